@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from typing import Optional
 from enum import Enum
 
+from app.prompts.emergency import critical_symptoms, fast_triage
 from app.services.ai import AIService
 
 
@@ -44,7 +45,20 @@ class IntentAgent:
         conversation_history: Optional[list[dict]] = None,
     ) -> IntentResult:
         """Detect user intent from a message."""
-        # First, check for emergency
+        # Obvious critical signs skip the LLM round-trip entirely
+        urgency_level = fast_triage(message)
+        if urgency_level:
+            symptoms = critical_symptoms(message)
+            return IntentResult(
+                intent=Intent.EMERGENCY,
+                confidence=0.95,
+                extracted_data={"symptoms": symptoms},
+                is_emergency=True,
+                urgency_level=urgency_level,
+                symptoms=symptoms,
+            )
+
+        # Otherwise let the LLM triage it
         emergency_result = await self.ai.detect_emergency(message, conversation_history)
 
         is_emergency = emergency_result.get("is_emergency", False)
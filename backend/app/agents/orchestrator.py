@@ -1,6 +1,7 @@
 """Orchestrator for coordinating conversation agents."""
 
 from dataclasses import dataclass
+from datetime import datetime, timezone
 from typing import Optional
 from uuid import UUID
 
@@ -74,16 +75,11 @@ class Orchestrator:
         caller_phone: str,
     ) -> str:
         """Handle voice input from user."""
+        received_at = datetime.now(timezone.utc)
+
         # Get conversation state
         state = await self.conversation_service.get_conversation_state(conversation_id)
 
-        # Add user message
-        await self.conversation_service.add_message(
-            conversation_id=conversation_id,
-            role="user",
-            content=speech_result,
-        )
-
         # Process based on current state
         response = await self._process_input(
             state=state,
@@ -92,12 +88,8 @@ class Orchestrator:
             channel="voice",
         )
 
-        # Add assistant message
-        await self.conversation_service.add_message(
-            conversation_id=conversation_id,
-            role="assistant",
-            content=response.message,
-        )
+        # Save user and assistant messages together
+        await self._save_exchange(conversation_id, speech_result, received_at, response.message)
 
         # Generate TwiML
         if response.end_conversation:
@@ -125,31 +117,19 @@ class Orchestrator:
         message_body: str,
     ) -> str:
         """Handle incoming WhatsApp message."""
+        received_at = datetime.now(timezone.utc)
+
         # Find or create conversation
-        conversation = await self.conversation_service.get_active_conversation(
+        conversation = await self.conversation_service.get_or_create_active_conversation(
             clinic_id=self.clinic.id,
-            client_phone=sender_phone,
             channel="whatsapp",
+            client_phone=sender_phone,
+            external_id=message_sid,
         )
 
-        if not conversation:
-            conversation = await self.conversation_service.create_conversation(
-                clinic_id=self.clinic.id,
-                channel="whatsapp",
-                external_id=message_sid,
-                client_phone=sender_phone,
-            )
-
         # Get conversation state
         state = await self.conversation_service.get_conversation_state(conversation.id)
 
-        # Add user message
-        await self.conversation_service.add_message(
-            conversation_id=conversation.id,
-            role="user",
-            content=message_body,
-        )
-
         # Process input
         response = await self._process_input(
             state=state,
@@ -158,12 +138,8 @@ class Orchestrator:
             channel="whatsapp",
         )
 
-        # Add assistant message
-        await self.conversation_service.add_message(
-            conversation_id=conversation.id,
-            role="assistant",
-            content=response.message,
-        )
+        # Save user and assistant messages together
+        await self._save_exchange(conversation.id, message_body, received_at, response.message)
 
         if response.end_conversation:
             await self.conversation_service.end_conversation(
@@ -173,6 +149,26 @@ class Orchestrator:
 
         return response.message
 
+    async def _save_exchange(
+        self,
+        conversation_id: UUID,
+        user_message: str,
+        received_at: datetime,
+        assistant_message: str,
+    ) -> None:
+        """Persist a user message and the reply to it in one round-trip."""
+        await self.conversation_service.add_messages(
+            conversation_id,
+            [
+                {"role": "user", "content": user_message, "created_at": received_at},
+                {
+                    "role": "assistant",
+                    "content": assistant_message,
+                    "created_at": datetime.now(timezone.utc),
+                },
+            ],
+        )
+
     async def _process_input(
         self,
         state,
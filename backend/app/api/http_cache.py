@@ -0,0 +1,30 @@
+"""HTTP conditional-request helpers (ETag / If-None-Match)."""
+
+import hashlib
+
+from fastapi import Request, Response
+
+
+def build_etag(*parts: object) -> str:
+    """Build a weak ETag from the values that determine a response body."""
+    digest = hashlib.blake2b(
+        "|".join(str(p) for p in parts).encode(), digest_size=12
+    ).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the request's If-None-Match header matches the ETag."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    return etag in (tag.strip() for tag in if_none_match.split(","))
+
+
+def not_modified(etag: str) -> Response:
+    """Build an empty 304 response carrying the current ETag."""
+    return Response(status_code=304, headers={"ETag": etag})
@@ -0,0 +1,21 @@
+"""Shared TwiML response bodies."""
+
+from fastapi import Response
+
+# Static TwiML bodies are kept as encoded bytes so each webhook response
+# reuses them instead of rebuilding and re-encoding the XML per request.
+EMPTY_TWIML = b'<?xml version="1.0" encoding="UTF-8"?><Response/>'
+
+# Sent to the client whenever their message could not be processed
+FALLBACK_MESSAGE = (
+    "Lo sentimos, estamos experimentando dificultades técnicas. "
+    "Por favor intenta de nuevo más tarde o llama directamente a la clínica."
+)
+
+# Webhook replies are per-call and must never be cached by intermediaries
+_TWIML_HEADERS = {"Cache-Control": "no-store"}
+
+
+def twiml_response(content: bytes | str) -> Response:
+    """Wrap a TwiML body in an XML response."""
+    return Response(content=content, media_type="application/xml", headers=_TWIML_HEADERS)
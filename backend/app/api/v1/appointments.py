@@ -5,6 +5,7 @@ from typing import Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy import select, and_, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -24,9 +25,9 @@ from app.api.deps import CurrentClinic, DBSession
 router = APIRouter()
 
 
-def appointment_to_response(apt: Appointment) -> AppointmentResponse:
-    """Convert appointment model to response schema."""
-    return AppointmentResponse(
+def _appointment_fields(apt: Appointment) -> dict:
+    """Response fields of an appointment (client, pet and staff loaded)."""
+    return dict(
         id=apt.id,
         clinic_id=apt.clinic_id,
         client_id=apt.client_id,
@@ -49,7 +50,12 @@ def appointment_to_response(apt: Appointment) -> AppointmentResponse:
     )
 
 
-@router.get("", response_model=list[AppointmentResponse])
+def appointment_to_response(apt: Appointment) -> AppointmentResponse:
+    """Convert appointment model to response schema."""
+    return AppointmentResponse(**_appointment_fields(apt))
+
+
+@router.get("", response_model=list[AppointmentResponse], response_class=ORJSONResponse)
 async def list_appointments(
     current_clinic: CurrentClinic,
     db: DBSession,
@@ -86,7 +92,7 @@ async def list_appointments(
     result = await db.execute(query)
     appointments = result.scalars().all()
 
-    return [appointment_to_response(apt) for apt in appointments]
+    return ORJSONResponse([_appointment_fields(apt) for apt in appointments])
 
 
 @router.post("", response_model=AppointmentResponse, status_code=status.HTTP_201_CREATED)
@@ -3,7 +3,7 @@
 from datetime import datetime, timedelta
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from fastapi.security import OAuth2PasswordRequestForm
 from jose import jwt
 from passlib.context import CryptContext
@@ -18,6 +18,8 @@ from app.api.deps import CurrentUser
 
 router = APIRouter()
 
+_LOGGED_OUT_JSON = b'{"message":"Logged out successfully"}'
+
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
@@ -98,7 +100,7 @@ async def get_current_user_info(
 @router.post("/logout")
 async def logout():
     """Logout (client should discard token)."""
-    return {"message": "Logged out successfully"}
+    return Response(content=_LOGGED_OUT_JSON, media_type="application/json")
 
 
 @router.post("/setup")
@@ -2,6 +2,7 @@
 
 import logging
 import re
+from datetime import datetime, timezone
 from typing import Optional
 from uuid import UUID
 
@@ -129,12 +130,8 @@ async def send_chat_message(
             conversation.id
         )
 
-        # Add user message
-        await orchestrator.conversation_service.add_message(
-            conversation_id=conversation.id,
-            role="user",
-            content=data.message,
-        )
+        # Stored together with the reply once it's generated
+        received_at = datetime.now(timezone.utc)
 
         # Process through orchestrator, with fallback on OpenAI errors
         try:
@@ -148,11 +145,8 @@ async def send_chat_message(
             logger.warning(f"OpenAI unavailable, using fallback: {ai_err}")
             response = _fallback_response(data.message)
 
-        # Store assistant response
-        await orchestrator.conversation_service.add_message(
-            conversation_id=conversation.id,
-            role="assistant",
-            content=response.message,
+        await orchestrator._save_exchange(
+            conversation.id, data.message, received_at, response.message
         )
 
         if response.end_conversation:
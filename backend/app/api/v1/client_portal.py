@@ -1,6 +1,7 @@
 """Client portal endpoints for appointments, pets, and chat."""
 
 import logging
+from datetime import datetime, timezone
 from typing import List, Optional
 from uuid import UUID
 
@@ -106,7 +107,7 @@ async def get_client_appointments(
                 id=apt.id,
                 pet_name=pet_name,
                 pet_species=pet_species,
-                scheduled_at=apt.start_time.isoformat(),
+                scheduled_at=apt.start_time,
                 duration_minutes=apt.duration_minutes,
                 reason=apt.reason,
                 status=apt.status,
@@ -198,12 +199,8 @@ async def send_portal_chat_message(
             conversation.id
         )
 
-        # Add user message
-        await orchestrator.conversation_service.add_message(
-            conversation_id=conversation.id,
-            role="user",
-            content=data.message,
-        )
+        # Stored together with the reply once it's generated
+        received_at = datetime.now(timezone.utc)
 
         # Process through orchestrator
         try:
@@ -217,11 +214,8 @@ async def send_portal_chat_message(
             logger.warning(f"OpenAI unavailable, using fallback: {ai_err}")
             response = _fallback_response(data.message)
 
-        # Store assistant response
-        await orchestrator.conversation_service.add_message(
-            conversation_id=conversation.id,
-            role="assistant",
-            content=response.message,
+        await orchestrator._save_exchange(
+            conversation.id, data.message, received_at, response.message
         )
 
         if response.end_conversation:
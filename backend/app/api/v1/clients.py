@@ -4,7 +4,7 @@ from typing import Optional
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Query
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
 from sqlalchemy import select, func
 from sqlalchemy.orm import selectinload
 
@@ -24,8 +24,7 @@ class PetResponse(BaseModel):
     breed: Optional[str] = None
     notes: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ClientResponse(BaseModel):
@@ -34,11 +33,10 @@ class ClientResponse(BaseModel):
     name: Optional[str] = None
     email: Optional[str] = None
     created_at: str
-    pets: list[PetResponse] = []
+    pets: list[PetResponse] = Field(default_factory=list)
     appointment_count: int = 0
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ClientCreate(BaseModel):
@@ -4,7 +4,7 @@ from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
@@ -17,6 +17,8 @@ from app.schemas.clinic import (
     StaffUpdate,
 )
 from app.api.deps import CurrentUser, CurrentClinic, DBSession
+from app.services import settings_cache
+from app.services.clinic_lookup import invalidate_clinic_lookups
 
 router = APIRouter()
 
@@ -45,6 +47,9 @@ async def update_clinic(
     await db.commit()
     await db.refresh(current_clinic)
 
+    settings_cache.invalidate(current_clinic.id)
+    invalidate_clinic_lookups()
+
     return current_clinic
 
 
@@ -67,18 +72,14 @@ async def create_staff(
     db: DBSession,
 ):
     """Create a new staff member."""
-    staff = Staff(
-        clinic_id=current_clinic.id,
-        name=staff_data.name,
-        role=staff_data.role,
-        phone=staff_data.phone,
-        email=staff_data.email,
-        is_on_call=staff_data.is_on_call,
+    # INSERT ... RETURNING: one round-trip instead of insert + refresh
+    result = await db.execute(
+        insert(Staff)
+        .values(clinic_id=current_clinic.id, **staff_data.model_dump())
+        .returning(Staff)
     )
-
-    db.add(staff)
+    staff = result.scalar_one()
     await db.commit()
-    await db.refresh(staff)
 
     return staff
 
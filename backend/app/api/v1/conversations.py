@@ -1,23 +1,28 @@
 """Conversation endpoints."""
 
-from datetime import date, datetime
+from datetime import date, datetime, time
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse
 from sqlalchemy import select, func
-from sqlalchemy.orm import selectinload
 
 from app.models import Conversation, ConversationMessage, Client
 from app.schemas.conversation import ConversationResponse, ConversationMessageResponse
 from app.api.deps import CurrentClinic, DBSession
+from app.api.http_cache import build_etag, etag_matches, not_modified
 
 router = APIRouter()
 
+# Day boundaries for date-range filters
+_DAY_START = time.min
+_DAY_END = time.max
 
-def conversation_to_response(conv: Conversation, message_count: int = 0) -> ConversationResponse:
-    """Convert conversation model to response schema."""
-    return ConversationResponse(
+
+def _conversation_fields(conv: Conversation, message_count: int = 0) -> dict:
+    """Response fields of a conversation (client loaded)."""
+    return dict(
         id=conv.id,
         clinic_id=conv.clinic_id,
         client_id=conv.client_id,
@@ -35,7 +40,12 @@ def conversation_to_response(conv: Conversation, message_count: int = 0) -> Conv
     )
 
 
-@router.get("", response_model=list[ConversationResponse])
+def conversation_to_response(conv: Conversation, message_count: int = 0) -> ConversationResponse:
+    """Convert conversation model to response schema."""
+    return ConversationResponse(**_conversation_fields(conv, message_count))
+
+
+@router.get("", response_model=list[ConversationResponse], response_class=ORJSONResponse)
 async def list_conversations(
     current_clinic: CurrentClinic,
     db: DBSession,
@@ -47,11 +57,7 @@ async def list_conversations(
     offset: int = Query(0),
 ):
     """List conversations with optional filters."""
-    query = (
-        select(Conversation)
-        .where(Conversation.clinic_id == current_clinic.id)
-        .options(selectinload(Conversation.client))
-    )
+    query = select(Conversation).where(Conversation.clinic_id == current_clinic.id)
 
     if channel:
         query = query.where(Conversation.channel == channel)
@@ -60,43 +66,51 @@ async def list_conversations(
         query = query.where(Conversation.status == status)
 
     if start_date:
-        query = query.where(Conversation.started_at >= datetime.combine(start_date, datetime.min.time()))
+        query = query.where(Conversation.started_at >= datetime.combine(start_date, _DAY_START))
 
     if end_date:
-        query = query.where(Conversation.started_at <= datetime.combine(end_date, datetime.max.time()))
+        query = query.where(Conversation.started_at <= datetime.combine(end_date, _DAY_END))
 
     query = query.order_by(Conversation.started_at.desc()).offset(offset).limit(limit)
 
     result = await db.execute(query)
     conversations = result.scalars().all()
 
-    # Get message counts
-    responses = []
-    for conv in conversations:
+    # Message counts for the whole page in one grouped query; count(*) over
+    # conversation_id alone is answered from the (conversation_id, created_at)
+    # index without touching the message rows
+    message_counts = {}
+    if conversations:
         count_result = await db.execute(
-            select(func.count(ConversationMessage.id))
-            .where(ConversationMessage.conversation_id == conv.id)
+            select(ConversationMessage.conversation_id, func.count())
+            .where(ConversationMessage.conversation_id.in_([c.id for c in conversations]))
+            .group_by(ConversationMessage.conversation_id)
         )
-        message_count = count_result.scalar() or 0
-        responses.append(conversation_to_response(conv, message_count))
+        message_counts = dict(count_result.all())
 
-    return responses
+    return ORJSONResponse([
+        _conversation_fields(conv, message_counts.get(conv.id, 0)) for conv in conversations
+    ])
 
 
 @router.get("/{conversation_id}", response_model=ConversationResponse)
 async def get_conversation(
     conversation_id: UUID,
+    request: Request,
+    response: Response,
     current_clinic: CurrentClinic,
     db: DBSession,
 ):
-    """Get a specific conversation."""
+    """Get a specific conversation.
+
+    Supports conditional requests: returns 304 when If-None-Match matches.
+    """
     result = await db.execute(
         select(Conversation)
         .where(
             Conversation.id == conversation_id,
             Conversation.clinic_id == current_clinic.id,
         )
-        .options(selectinload(Conversation.client))
     )
     conversation = result.scalar_one_or_none()
 
@@ -104,15 +118,33 @@ async def get_conversation(
         raise HTTPException(status_code=404, detail="Conversation not found")
 
     count_result = await db.execute(
-        select(func.count(ConversationMessage.id))
+        select(func.count())
+        .select_from(ConversationMessage)
         .where(ConversationMessage.conversation_id == conversation.id)
     )
     message_count = count_result.scalar() or 0
 
+    etag = build_etag(
+        conversation.id,
+        conversation.status,
+        conversation.intent,
+        conversation.outcome,
+        conversation.ended_at,
+        conversation.client_id,
+        message_count,
+    )
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+
     return conversation_to_response(conversation, message_count)
 
 
-@router.get("/{conversation_id}/messages", response_model=list[ConversationMessageResponse])
+@router.get(
+    "/{conversation_id}/messages",
+    response_model=list[ConversationMessageResponse],
+    response_class=ORJSONResponse,
+)
 async def get_conversation_messages(
     conversation_id: UUID,
     current_clinic: CurrentClinic,
@@ -138,8 +170,8 @@ async def get_conversation_messages(
     )
     messages = result.scalars().all()
 
-    return [
-        ConversationMessageResponse(
+    return ORJSONResponse([
+        dict(
             id=msg.id,
             role=msg.role,
             content=msg.content,
@@ -148,4 +180,4 @@ async def get_conversation_messages(
             created_at=msg.created_at,
         )
         for msg in messages
-    ]
+    ])
@@ -2,12 +2,14 @@
 
 import asyncio
 import logging
+from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
 from fastapi import APIRouter, BackgroundTasks, HTTPException, Query
-from pydantic import BaseModel, EmailStr
-from sqlalchemy import select, desc
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, EmailStr
+from sqlalchemy import desc, insert, select
 
 from app.models.demo_request import DemoRequest
 from app.api.deps import CurrentUser, DBSession
@@ -17,6 +19,10 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+_DEMO_STATUSES = ("pending", "contacted", "converted", "dismissed")
+VALID_DEMO_STATUSES: frozenset[str] = frozenset(_DEMO_STATUSES)
+_INVALID_STATUS_DETAIL = f"Invalid status. Must be one of: {', '.join(_DEMO_STATUSES)}"
+
 
 class DemoRequestCreate(BaseModel):
     """Schema for creating a demo request (public, no auth)."""
@@ -42,10 +48,9 @@ class DemoRequestResponse(BaseModel):
     preferred_time: Optional[str] = None
     message: Optional[str] = None
     status: str
-    created_at: str
+    created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class DemoRequestStatusUpdate(BaseModel):
@@ -54,26 +59,19 @@ class DemoRequestStatusUpdate(BaseModel):
     status: str  # pending, contacted, converted, dismissed
 
 
-@router.post("", status_code=201)
+@router.post("", status_code=201, response_model=None)
 async def create_demo_request(
     data: DemoRequestCreate,
     db: DBSession,
     background_tasks: BackgroundTasks,
 ):
     """Create a demo request (public endpoint, no auth required)."""
-    demo_request = DemoRequest(
-        clinic_name=data.clinic_name,
-        contact_name=data.contact_name,
-        email=data.email,
-        phone=data.phone,
-        clinic_size=data.clinic_size,
-        preferred_time=data.preferred_time,
-        message=data.message,
+    # INSERT ... RETURNING: one round-trip instead of insert + refresh
+    result = await db.execute(
+        insert(DemoRequest).values(**data.model_dump()).returning(DemoRequest.id)
     )
-
-    db.add(demo_request)
+    demo_request_id = result.scalar_one()
     await db.commit()
-    await db.refresh(demo_request)
 
     # Send email notification in background
     background_tasks.add_task(
@@ -87,14 +85,17 @@ async def create_demo_request(
         message=data.message,
     )
 
-    return {
-        "success": True,
-        "message": "Solicitud de demo recibida correctamente",
-        "id": str(demo_request.id),
-    }
+    return ORJSONResponse(
+        {
+            "success": True,
+            "message": "Solicitud de demo recibida correctamente",
+            "id": str(demo_request_id),
+        },
+        status_code=201,
+    )
 
 
-@router.get("", response_model=list[DemoRequestResponse])
+@router.get("", response_model=list[DemoRequestResponse], response_class=ORJSONResponse)
 async def list_demo_requests(
     current_user: CurrentUser,
     db: DBSession,
@@ -116,8 +117,8 @@ async def list_demo_requests(
     result = await db.execute(query)
     requests = result.scalars().all()
 
-    return [
-        DemoRequestResponse(
+    return ORJSONResponse([
+        dict(
             id=r.id,
             clinic_name=r.clinic_name,
             contact_name=r.contact_name,
@@ -127,13 +128,13 @@ async def list_demo_requests(
             preferred_time=r.preferred_time,
             message=r.message,
             status=r.status,
-            created_at=r.created_at.isoformat(),
+            created_at=r.created_at,
         )
         for r in requests
-    ]
+    ])
 
 
-@router.patch("/{request_id}")
+@router.patch("/{request_id}", response_model=None)
 async def update_demo_request_status(
     request_id: UUID,
     update_data: DemoRequestStatusUpdate,
@@ -152,14 +153,10 @@ async def update_demo_request_status(
     if not demo_request:
         raise HTTPException(status_code=404, detail="Demo request not found")
 
-    valid_statuses = ["pending", "contacted", "converted", "dismissed"]
-    if update_data.status not in valid_statuses:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid status. Must be one of: {', '.join(valid_statuses)}",
-        )
+    if update_data.status not in VALID_DEMO_STATUSES:
+        raise HTTPException(status_code=400, detail=_INVALID_STATUS_DETAIL)
 
     demo_request.status = update_data.status
     await db.commit()
 
-    return {"success": True, "status": demo_request.status}
+    return ORJSONResponse({"success": True, "status": demo_request.status})
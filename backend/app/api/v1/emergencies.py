@@ -1,18 +1,23 @@
 """Emergency management API endpoints."""
 
+import asyncio
 import uuid
 from datetime import datetime
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from pydantic import BaseModel
-from sqlalchemy import select, func, desc
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict
+from sqlalchemy import select, func, desc, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
-from app.database import get_db
+from app.database import execute_scalar, get_db
 from app.api.deps import get_current_user
+from app.api.http_cache import build_etag, etag_matches, not_modified
 from app.models import Staff, EmergencyEvent, EmergencyAlert, Client, Conversation
+from app.services import emergency_cache
+from app.services.emergency_access import register_false_emergency
 
 router = APIRouter(prefix="/emergencies", tags=["emergencies"])
 
@@ -37,8 +42,7 @@ class EmergencyResponse(BaseModel):
     client_name: Optional[str] = None
     alerts_sent: int = 0
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class EmergencyListResponse(BaseModel):
@@ -66,15 +70,14 @@ class EmergencyAlertResponse(BaseModel):
     delivered_at: Optional[datetime]
     error_message: Optional[str]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ===========================================
 # Endpoints
 # ===========================================
 
-@router.get("", response_model=EmergencyListResponse)
+@router.get("", response_model=EmergencyListResponse, response_class=ORJSONResponse)
 async def list_emergencies(
     status: Optional[str] = Query(None, description="Filter by status: active, acknowledged, resolved"),
     limit: int = Query(50, ge=1, le=100),
@@ -92,24 +95,26 @@ async def list_emergencies(
     if status:
         query = query.where(EmergencyEvent.status == status)
 
-    # Get total count
+    # Total count
     count_query = select(func.count()).select_from(
         query.subquery()
     )
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
 
-    # Get active count
+    # Active count
     active_query = select(func.count()).where(
         EmergencyEvent.clinic_id == current_user.clinic_id,
         EmergencyEvent.status == "active"
     )
-    active_result = await db.execute(active_query)
-    active_count = active_result.scalar() or 0
 
-    # Get paginated results
+    # Run both counts on their own pooled sessions, concurrently with the page
     query = query.offset(offset).limit(limit)
-    result = await db.execute(query)
+    total, active_count, result = await asyncio.gather(
+        execute_scalar(count_query),
+        execute_scalar(active_query),
+        db.execute(query),
+    )
+    total = total or 0
+    active_count = active_count or 0
     emergencies = result.scalars().all()
 
     # Build response
@@ -129,7 +134,7 @@ async def list_emergencies(
         alerts_result = await db.execute(alerts_query)
         alerts_sent = alerts_result.scalar() or 0
 
-        items.append(EmergencyResponse(
+        items.append(dict(
             id=str(emergency.id),
             client_phone=emergency.client_phone,
             pet_name=emergency.pet_name,
@@ -146,23 +151,52 @@ async def list_emergencies(
             alerts_sent=alerts_sent
         ))
 
-    return EmergencyListResponse(
-        items=items,
-        total=total,
-        active_count=active_count
-    )
+    return ORJSONResponse({
+        "items": items,
+        "total": total,
+        "active_count": active_count,
+    })
 
 
-@router.get("/active", response_model=list[EmergencyResponse])
+@router.get("/active", response_model=list[EmergencyResponse], response_class=ORJSONResponse)
 async def get_active_emergencies(
+    request: Request,
     db: AsyncSession = Depends(get_db),
     current_user: Staff = Depends(get_current_user),
 ):
-    """Get all active emergencies (quick endpoint for dashboard)."""
+    """Get all active emergencies (quick endpoint for dashboard).
+
+    Polled by the dashboard: the serialized payload is cached per clinic
+    (invalidated via LISTEN/NOTIFY), and on a miss a cheap count/max probe
+    answers If-None-Match with 304 before loading the rows.
+    """
+    clinic_id = current_user.clinic_id
+
+    cached = emergency_cache.get(clinic_id)
+    if cached is not None:
+        etag, body = cached
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+    snapshot = emergency_cache.version(clinic_id)
+
+    probe = await db.execute(
+        select(func.count(), func.max(EmergencyEvent.created_at)).where(
+            EmergencyEvent.clinic_id == clinic_id,
+            EmergencyEvent.status == "active"
+        )
+    )
+    active_count, latest_created_at = probe.one()
+
+    etag = build_etag(clinic_id, active_count, latest_created_at)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
     result = await db.execute(
         select(EmergencyEvent)
         .where(
-            EmergencyEvent.clinic_id == current_user.clinic_id,
+            EmergencyEvent.clinic_id == clinic_id,
             EmergencyEvent.status == "active"
         )
         .order_by(desc(EmergencyEvent.created_at))
@@ -172,7 +206,7 @@ async def get_active_emergencies(
 
     items = []
     for emergency in emergencies:
-        items.append(EmergencyResponse(
+        items.append(dict(
             id=str(emergency.id),
             client_phone=emergency.client_phone,
             pet_name=emergency.pet_name,
@@ -184,31 +218,34 @@ async def get_active_emergencies(
             acknowledged_at=emergency.acknowledged_at,
             resolved_at=emergency.resolved_at,
             resolution_notes=emergency.resolution_notes,
-            created_at=emergency.created_at
+            created_at=emergency.created_at,
+            client_name=None,
+            alerts_sent=0,
         ))
 
-    return items
+    response = ORJSONResponse(items, headers={"ETag": etag})
+    emergency_cache.store(clinic_id, snapshot, etag, response.body)
+
+    return response
 
 
 @router.get("/{emergency_id}", response_model=EmergencyResponse)
 async def get_emergency(
     emergency_id: uuid.UUID,
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
     current_user: Staff = Depends(get_current_user),
 ):
-    """Get a specific emergency by ID."""
+    """Get a specific emergency by ID.
+
+    Supports conditional requests: returns 304 when If-None-Match matches.
+    """
     emergency = await db.get(EmergencyEvent, emergency_id)
 
     if not emergency or emergency.clinic_id != current_user.clinic_id:
         raise HTTPException(status_code=404, detail="Emergency not found")
 
-    # Get client name
-    client_name = None
-    if emergency.client_id:
-        client = await db.get(Client, emergency.client_id)
-        if client:
-            client_name = client.name
-
     # Count alerts
     alerts_query = select(func.count()).where(
         EmergencyAlert.emergency_id == emergency.id
@@ -216,6 +253,24 @@ async def get_emergency(
     alerts_result = await db.execute(alerts_query)
     alerts_sent = alerts_result.scalar() or 0
 
+    etag = build_etag(
+        emergency.id,
+        emergency.status,
+        emergency.acknowledged_at,
+        emergency.resolved_at,
+        alerts_sent,
+    )
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+
+    # Get client name
+    client_name = None
+    if emergency.client_id:
+        client = await db.get(Client, emergency.client_id)
+        if client:
+            client_name = client.name
+
     return EmergencyResponse(
         id=str(emergency.id),
         client_phone=emergency.client_phone,
@@ -268,31 +323,57 @@ async def get_emergency_alerts(
     ]
 
 
-@router.post("/{emergency_id}/acknowledge")
+async def _raise_not_updatable(
+    db: AsyncSession, emergency_id: uuid.UUID, clinic_id: uuid.UUID, detail: str
+) -> None:
+    """Raise 404 if the emergency doesn't exist for the clinic, else 400."""
+    status = await db.scalar(
+        select(EmergencyEvent.status).where(
+            EmergencyEvent.id == emergency_id,
+            EmergencyEvent.clinic_id == clinic_id,
+        )
+    )
+    if status is None:
+        raise HTTPException(status_code=404, detail="Emergency not found")
+    raise HTTPException(status_code=400, detail=detail)
+
+
+@router.post("/{emergency_id}/acknowledge", response_model=None)
 async def acknowledge_emergency(
     emergency_id: uuid.UUID,
     db: AsyncSession = Depends(get_db),
     current_user: Staff = Depends(get_current_user),
 ):
     """Mark an emergency as acknowledged."""
-    emergency = await db.get(EmergencyEvent, emergency_id)
-
-    if not emergency or emergency.clinic_id != current_user.clinic_id:
-        raise HTTPException(status_code=404, detail="Emergency not found")
-
-    if emergency.status != "active":
-        raise HTTPException(status_code=400, detail="Emergency is not active")
+    # Single conditional UPDATE; the DB sets the timestamp
+    result = await db.execute(
+        update(EmergencyEvent)
+        .where(
+            EmergencyEvent.id == emergency_id,
+            EmergencyEvent.clinic_id == current_user.clinic_id,
+            EmergencyEvent.status == "active",
+        )
+        .values(
+            status="acknowledged",
+            acknowledged_at=func.now(),
+            acknowledged_by=current_user.id,
+        )
+        .returning(EmergencyEvent.id)
+        .execution_options(synchronize_session=False)
+    )
 
-    emergency.status = "acknowledged"
-    emergency.acknowledged_at = datetime.utcnow()
-    emergency.acknowledged_by = current_user.id
+    if result.first() is None:
+        await _raise_not_updatable(
+            db, emergency_id, current_user.clinic_id, "Emergency is not active"
+        )
 
     await db.commit()
+    emergency_cache.invalidate(current_user.clinic_id)
 
-    return {"message": "Emergency acknowledged", "status": "acknowledged"}
+    return ORJSONResponse({"message": "Emergency acknowledged", "status": "acknowledged"})
 
 
-@router.post("/{emergency_id}/resolve")
+@router.post("/{emergency_id}/resolve", response_model=None)
 async def resolve_emergency(
     emergency_id: uuid.UUID,
     request: ResolveRequest,
@@ -300,38 +381,43 @@ async def resolve_emergency(
     current_user: Staff = Depends(get_current_user),
 ):
     """Mark an emergency as resolved."""
-    emergency = await db.get(EmergencyEvent, emergency_id)
+    new_status = "false_alarm" if request.was_false_alarm else "resolved"
 
-    if not emergency or emergency.clinic_id != current_user.clinic_id:
-        raise HTTPException(status_code=404, detail="Emergency not found")
-
-    if emergency.status == "resolved":
-        raise HTTPException(status_code=400, detail="Emergency already resolved")
+    # Single conditional UPDATE; the DB sets the timestamp
+    result = await db.execute(
+        update(EmergencyEvent)
+        .where(
+            EmergencyEvent.id == emergency_id,
+            EmergencyEvent.clinic_id == current_user.clinic_id,
+            EmergencyEvent.status != "resolved",
+        )
+        .values(
+            status=new_status,
+            resolved_at=func.now(),
+            resolved_by=current_user.id,
+            resolution_notes=request.notes,
+        )
+        .returning(EmergencyEvent.client_id)
+        .execution_options(synchronize_session=False)
+    )
+    row = result.first()
 
-    # Update emergency
-    if request.was_false_alarm:
-        emergency.status = "false_alarm"
-        # Increment client's false emergency count
-        if emergency.client_id:
-            client = await db.get(Client, emergency.client_id)
-            if client:
-                client.false_emergency_count += 1
-                if client.false_emergency_count >= 2:
-                    client.emergency_access_revoked = True
-    else:
-        emergency.status = "resolved"
+    if row is None:
+        await _raise_not_updatable(
+            db, emergency_id, current_user.clinic_id, "Emergency already resolved"
+        )
 
-    emergency.resolved_at = datetime.utcnow()
-    emergency.resolved_by = current_user.id
-    emergency.resolution_notes = request.notes
+    if request.was_false_alarm and row.client_id:
+        await register_false_emergency(db, row.client_id)
 
     await db.commit()
+    emergency_cache.invalidate(current_user.clinic_id)
 
-    return {
+    return ORJSONResponse({
         "message": "Emergency resolved",
-        "status": emergency.status,
+        "status": new_status,
         "was_false_alarm": request.was_false_alarm
-    }
+    })
 
 
 @router.get("/{emergency_id}/conversation")
@@ -351,7 +437,7 @@ async def get_emergency_conversation(
 
     result = await db.execute(
         select(Conversation)
-        .options(selectinload(Conversation.messages))
+        .options(selectinload(Conversation.messages), raiseload("*"))
         .where(Conversation.id == emergency.conversation_id)
     )
     conversation = result.scalar_one_or_none()
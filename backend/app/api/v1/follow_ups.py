@@ -1,23 +1,30 @@
 """Follow-up management API endpoints."""
 
+import asyncio
+import base64
 import uuid
 from datetime import datetime, timedelta
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from pydantic import BaseModel
-from sqlalchemy import select, func, desc
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from pydantic import BaseModel, ConfigDict, Field
+from sqlalchemy import insert, select, func, desc, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only, selectinload
 
-from app.database import get_db
+from app.database import execute_one, get_db
 from app.api.deps import get_current_user
 from app.models import (
     Staff, FollowUp, FollowUpProtocol, FollowUpResponse,
-    Appointment, Client, Pet
+    Appointment, Client
 )
 
 router = APIRouter(prefix="/follow-ups", tags=["follow-ups"])
 
+# Static response bodies, serialized once
+_CANCELLED_JSON = b'{"message":"Follow-up cancelled"}'
+_PROTOCOL_DELETED_JSON = b'{"message":"Protocol deleted"}'
+
 
 # ===========================================
 # Schemas
@@ -38,14 +45,14 @@ class FollowUpResponse_(BaseModel):
     pet_name: Optional[str] = None
     appointment_reason: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class FollowUpListResponse(BaseModel):
     items: list[FollowUpResponse_]
     total: int
     pending_count: int
+    next_cursor: Optional[str] = None
 
 
 class ProtocolResponse(BaseModel):
@@ -57,8 +64,7 @@ class ProtocolResponse(BaseModel):
     message_templates: list[str]
     escalation_keywords: list[str]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class CreateProtocolRequest(BaseModel):
@@ -66,7 +72,7 @@ class CreateProtocolRequest(BaseModel):
     procedure_type: str
     schedule_hours: list[int]
     message_templates: list[str]
-    escalation_keywords: list[str] = []
+    escalation_keywords: list[str] = Field(default_factory=list)
 
 
 class UpdateProtocolRequest(BaseModel):
@@ -78,11 +84,27 @@ class UpdateProtocolRequest(BaseModel):
 
 
 class ScheduleFollowUpsRequest(BaseModel):
-    appointment_id: str
+    appointment_id: Optional[str] = None
+    appointment_ids: list[str] = Field(default_factory=list)
     protocol_id: Optional[str] = None
     procedure_type: Optional[str] = None
 
 
+def _encode_cursor(follow_up: FollowUp) -> str:
+    """Encode a follow-up's (scheduled_at, id) sort key as an opaque cursor."""
+    raw = f"{follow_up.scheduled_at.isoformat()}|{follow_up.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    """Decode a cursor produced by _encode_cursor."""
+    try:
+        scheduled_at, follow_up_id = base64.urlsafe_b64decode(cursor).decode().split("|")
+        return datetime.fromisoformat(scheduled_at), uuid.UUID(follow_up_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
 # ===========================================
 # Follow-up Endpoints
 # ===========================================
@@ -91,7 +113,7 @@ class ScheduleFollowUpsRequest(BaseModel):
 async def list_follow_ups(
     status: Optional[str] = Query(None, description="Filter by status"),
     limit: int = Query(50, ge=1, le=100),
-    offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
     db: AsyncSession = Depends(get_db),
     current_user: Staff = Depends(get_current_user),
 ):
@@ -99,36 +121,56 @@ async def list_follow_ups(
     query = (
         select(FollowUp)
         .where(FollowUp.clinic_id == current_user.clinic_id)
-        .order_by(FollowUp.scheduled_at)
+        .order_by(FollowUp.scheduled_at, FollowUp.id)
     )
 
     if status:
         query = query.where(FollowUp.status == status)
 
-    # Get total count
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
+    # Keyset pagination: seek past the last row of the previous page
+    if cursor:
+        query = query.where(
+            tuple_(FollowUp.scheduled_at, FollowUp.id) > _decode_cursor(cursor)
+        )
 
-    # Get pending count
-    pending_query = select(func.count()).where(
-        FollowUp.clinic_id == current_user.clinic_id,
-        FollowUp.status == "pending"
+    # Get total (status-filtered) and pending counts in one scan
+    total_count = func.count()
+    if status:
+        total_count = total_count.filter(FollowUp.status == status)
+    counts_query = select(
+        total_count,
+        func.count().filter(FollowUp.status == "pending"),
+    ).where(FollowUp.clinic_id == current_user.clinic_id)
+
+    # Get paginated results (one extra row tells whether there is a next
+    # page), batch-loading related rows (one IN query each)
+    query = (
+        query.limit(limit + 1)
+        .options(
+            selectinload(FollowUp.client),
+            selectinload(FollowUp.pet),
+            selectinload(FollowUp.appointment),
+        )
     )
-    pending_result = await db.execute(pending_query)
-    pending_count = pending_result.scalar() or 0
 
-    # Get paginated results
-    query = query.offset(offset).limit(limit)
-    result = await db.execute(query)
+    # Counts run on their own pooled session, concurrently with the page
+    (total, pending_count), result = await asyncio.gather(
+        execute_one(counts_query),
+        db.execute(query),
+    )
     follow_ups = result.scalars().all()
 
+    next_cursor = None
+    if len(follow_ups) > limit:
+        follow_ups = follow_ups[:limit]
+        next_cursor = _encode_cursor(follow_ups[-1])
+
     # Build response with related data
     items = []
     for fu in follow_ups:
-        client = await db.get(Client, fu.client_id) if fu.client_id else None
-        pet = await db.get(Pet, fu.pet_id) if fu.pet_id else None
-        appointment = await db.get(Appointment, fu.appointment_id)
+        client = fu.client
+        pet = fu.pet
+        appointment = fu.appointment
 
         items.append(FollowUpResponse_(
             id=str(fu.id),
@@ -149,7 +191,8 @@ async def list_follow_ups(
     return FollowUpListResponse(
         items=items,
         total=total,
-        pending_count=pending_count
+        pending_count=pending_count,
+        next_cursor=next_cursor
     )
 
 
@@ -171,13 +214,24 @@ async def get_pending_follow_ups(
         )
         .order_by(FollowUp.scheduled_at)
         .limit(20)
+        .options(
+            # Only columns in idx_follow_ups_clinic_pending_scheduled
+            load_only(
+                FollowUp.id, FollowUp.appointment_id, FollowUp.client_id,
+                FollowUp.pet_id, FollowUp.message_template,
+                FollowUp.sequence_number, FollowUp.scheduled_at,
+                FollowUp.status, FollowUp.sent_at,
+            ),
+            selectinload(FollowUp.client),
+            selectinload(FollowUp.pet),
+        )
     )
     follow_ups = result.scalars().all()
 
     items = []
     for fu in follow_ups:
-        client = await db.get(Client, fu.client_id) if fu.client_id else None
-        pet = await db.get(Pet, fu.pet_id) if fu.pet_id else None
+        client = fu.client
+        pet = fu.pet
 
         items.append(FollowUpResponse_(
             id=str(fu.id),
@@ -203,10 +257,27 @@ async def schedule_follow_ups(
     db: AsyncSession = Depends(get_db),
     current_user: Staff = Depends(get_current_user),
 ):
-    """Schedule follow-ups for a completed appointment."""
-    appointment = await db.get(Appointment, uuid.UUID(request.appointment_id))
+    """Schedule follow-ups for one or more completed appointments."""
+    appointment_ids = list(dict.fromkeys(
+        uuid.UUID(a_id)
+        for a_id in ([request.appointment_id] if request.appointment_id else [])
+        + request.appointment_ids
+    ))
+    if not appointment_ids:
+        raise HTTPException(status_code=400, detail="appointment_id or appointment_ids is required")
+
+    # Load all appointments and their pets in two queries
+    result = await db.execute(
+        select(Appointment)
+        .where(
+            Appointment.id.in_(appointment_ids),
+            Appointment.clinic_id == current_user.clinic_id
+        )
+        .options(selectinload(Appointment.pet))
+    )
+    appointments = result.scalars().all()
 
-    if not appointment or appointment.clinic_id != current_user.clinic_id:
+    if len(appointments) != len(appointment_ids):
         raise HTTPException(status_code=404, detail="Appointment not found")
 
     # Get protocol
@@ -238,43 +309,51 @@ async def schedule_follow_ups(
         message_templates = protocol.message_templates
         escalation_keywords = protocol.escalation_keywords
 
-    # Get pet name for templates
-    pet_name = "tu mascota"
-    if appointment.pet_id:
-        pet = await db.get(Pet, appointment.pet_id)
-        if pet and pet.name:
-            pet_name = pet.name
-
     # Create follow-ups
-    base_time = appointment.end_time or appointment.start_time
-    created = []
-
-    for i, hours in enumerate(schedule_hours):
-        if i >= len(message_templates):
-            break
-
-        template = message_templates[i].replace("{pet_name}", pet_name)
-
-        follow_up = FollowUp(
-            clinic_id=current_user.clinic_id,
-            appointment_id=appointment.id,
-            client_id=appointment.client_id,
-            pet_id=appointment.pet_id,
-            protocol_id=protocol.id if protocol else None,
-            message_template=template,
-            escalation_keywords=escalation_keywords,
-            sequence_number=i + 1,
-            scheduled_at=base_time + timedelta(hours=hours),
-            status="pending"
+    rows = []
+
+    for appointment in appointments:
+        # Get pet name for templates
+        pet_name = "tu mascota"
+        if appointment.pet and appointment.pet.name:
+            pet_name = appointment.pet.name
+
+        base_time = appointment.end_time or appointment.start_time
+
+        for i, hours in enumerate(schedule_hours):
+            if i >= len(message_templates):
+                break
+
+            template = message_templates[i].replace("{pet_name}", pet_name)
+
+            rows.append({
+                "clinic_id": current_user.clinic_id,
+                "appointment_id": appointment.id,
+                "client_id": appointment.client_id,
+                "pet_id": appointment.pet_id,
+                "protocol_id": protocol.id if protocol else None,
+                "message_template": template,
+                "escalation_keywords": escalation_keywords,
+                "sequence_number": i + 1,
+                "scheduled_at": base_time + timedelta(hours=hours),
+                "status": "pending",
+            })
+
+    # Single multi-row INSERT instead of one per follow-up
+    follow_up_ids = []
+    if rows:
+        result = await db.execute(
+            insert(FollowUp)
+            .values(rows)
+            .returning(FollowUp.id)
+            .execution_options(synchronize_session=False)
         )
-        db.add(follow_up)
-        created.append(follow_up)
-
-    await db.commit()
+        follow_up_ids = result.scalars().all()
+        await db.commit()
 
     return {
-        "message": f"Scheduled {len(created)} follow-ups",
-        "follow_up_ids": [str(fu.id) for fu in created]
+        "message": f"Scheduled {len(follow_up_ids)} follow-ups",
+        "follow_up_ids": [str(fu_id) for fu_id in follow_up_ids]
     }
 
 
@@ -296,7 +375,7 @@ async def cancel_follow_up(
     follow_up.status = "cancelled"
     await db.commit()
 
-    return {"message": "Follow-up cancelled"}
+    return Response(content=_CANCELLED_JSON, media_type="application/json")
 
 
 @router.post("/{follow_up_id}/send-now")
@@ -308,33 +387,51 @@ async def send_follow_up_now(
     """Manually trigger a follow-up message immediately."""
     from app.services.whatsapp.sender import whatsapp_sender
 
-    follow_up = await db.get(FollowUp, follow_up_id)
+    # Follow-up fields and client phone in one round-trip
+    result = await db.execute(
+        select(FollowUp.status, FollowUp.message_template, Client.phone)
+        .outerjoin(Client, Client.id == FollowUp.client_id)
+        .where(
+            FollowUp.id == follow_up_id,
+            FollowUp.clinic_id == current_user.clinic_id
+        )
+    )
+    row = result.one_or_none()
 
-    if not follow_up or follow_up.clinic_id != current_user.clinic_id:
+    if not row:
         raise HTTPException(status_code=404, detail="Follow-up not found")
 
-    if follow_up.status != "pending":
+    status, message_template, client_phone = row
+
+    if status != "pending":
         raise HTTPException(status_code=400, detail="Follow-up is not pending")
 
-    # Get client phone
-    client = await db.get(Client, follow_up.client_id)
-    if not client:
+    if not client_phone:
         raise HTTPException(status_code=400, detail="Client not found")
 
     # Send message
-    result = await whatsapp_sender.send(client.phone, follow_up.message_template)
+    result = await whatsapp_sender.send(client_phone, message_template)
+    sent = result.get("status") == "sent"
+
+    # Record the outcome without loading the ORM object
+    values = (
+        {"status": "sent", "sent_at": func.now()}
+        if sent
+        else {"status": "failed", "error_message": result.get("message")}
+    )
+    await db.execute(
+        update(FollowUp)
+        .where(FollowUp.id == follow_up_id)
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
 
-    if result.get("status") == "sent":
-        follow_up.status = "sent"
-        follow_up.sent_at = datetime.utcnow()
-        await db.commit()
-        return {"message": "Follow-up sent", "status": "sent"}
-    else:
-        follow_up.status = "failed"
-        follow_up.error_message = result.get("message")
-        await db.commit()
+    if not sent:
         raise HTTPException(status_code=500, detail=f"Failed to send: {result.get('message')}")
 
+    return {"message": "Follow-up sent", "status": "sent"}
+
 
 # ===========================================
 # Protocol Endpoints
@@ -452,4 +549,4 @@ async def delete_protocol(
     await db.delete(protocol)
     await db.commit()
 
-    return {"message": "Protocol deleted"}
+    return Response(content=_PROTOCOL_DELETED_JSON, media_type="application/json")
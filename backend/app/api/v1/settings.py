@@ -1,25 +1,56 @@
 """Settings management endpoints."""
 
-from fastapi import APIRouter
+from typing import Any, Callable
+from uuid import UUID
 
+import orjson
+from fastapi import APIRouter, HTTPException, Response
+
+from app.models import Clinic
 from app.schemas.clinic import ClinicUpdate, WorkingHours, EscalationContact
-from app.api.deps import CurrentClinic, DBSession
+from app.api.deps import CurrentClinic, CurrentUser, DBSession
+from app.services import settings_cache
+from app.services.clinic_lookup import invalidate_clinic_lookups
 
 router = APIRouter()
 
 
+def _all_settings(clinic: Clinic) -> dict:
+    """Build the full settings payload for a clinic."""
+    return {
+        "working_hours": clinic.working_hours,
+        "appointment_durations": clinic.appointment_duration_minutes,
+        "escalation_contacts": clinic.escalation_contacts,
+        "timezone": clinic.timezone,
+        "custom_settings": clinic.settings,
+    }
+
+
+async def _cached_settings(
+    clinic_id: UUID,
+    section: str,
+    db: DBSession,
+    build: Callable[[Clinic], Any],
+) -> Response:
+    """Serve a settings section from the cache, loading the clinic on a miss."""
+    body = settings_cache.get(clinic_id, section)
+    if body is None:
+        clinic = await db.get(Clinic, clinic_id)
+        if clinic is None:
+            raise HTTPException(status_code=404, detail="Clinic not found")
+        body = orjson.dumps(build(clinic))
+        settings_cache.store(clinic_id, section, body)
+
+    return Response(content=body, media_type="application/json")
+
+
 @router.get("")
 async def get_settings(
-    current_clinic: CurrentClinic,
+    current_user: CurrentUser,
+    db: DBSession,
 ):
     """Get all clinic settings."""
-    return {
-        "working_hours": current_clinic.working_hours,
-        "appointment_durations": current_clinic.appointment_duration_minutes,
-        "escalation_contacts": current_clinic.escalation_contacts,
-        "timezone": current_clinic.timezone,
-        "custom_settings": current_clinic.settings,
-    }
+    return await _cached_settings(current_user.clinic_id, "all", db, _all_settings)
 
 
 @router.patch("")
@@ -38,21 +69,21 @@ async def update_settings(
     await db.commit()
     await db.refresh(current_clinic)
 
-    return {
-        "working_hours": current_clinic.working_hours,
-        "appointment_durations": current_clinic.appointment_duration_minutes,
-        "escalation_contacts": current_clinic.escalation_contacts,
-        "timezone": current_clinic.timezone,
-        "custom_settings": current_clinic.settings,
-    }
+    settings_cache.invalidate(current_clinic.id)
+    invalidate_clinic_lookups()
+
+    return _all_settings(current_clinic)
 
 
 @router.get("/hours")
 async def get_working_hours(
-    current_clinic: CurrentClinic,
+    current_user: CurrentUser,
+    db: DBSession,
 ):
     """Get working hours configuration."""
-    return current_clinic.working_hours
+    return await _cached_settings(
+        current_user.clinic_id, "hours", db, lambda clinic: clinic.working_hours
+    )
 
 
 @router.patch("/hours")
@@ -72,16 +103,21 @@ async def update_working_hours(
 
     current_clinic.working_hours = existing
     await db.commit()
+    settings_cache.invalidate(current_clinic.id)
+    invalidate_clinic_lookups()
 
     return current_clinic.working_hours
 
 
 @router.get("/durations")
 async def get_appointment_durations(
-    current_clinic: CurrentClinic,
+    current_user: CurrentUser,
+    db: DBSession,
 ):
     """Get appointment duration settings."""
-    return current_clinic.appointment_duration_minutes
+    return await _cached_settings(
+        current_user.clinic_id, "durations", db, lambda clinic: clinic.appointment_duration_minutes
+    )
 
 
 @router.patch("/durations")
@@ -96,16 +132,21 @@ async def update_appointment_durations(
 
     current_clinic.appointment_duration_minutes = existing
     await db.commit()
+    settings_cache.invalidate(current_clinic.id)
+    invalidate_clinic_lookups()
 
     return current_clinic.appointment_duration_minutes
 
 
 @router.get("/escalation")
 async def get_escalation_contacts(
-    current_clinic: CurrentClinic,
+    current_user: CurrentUser,
+    db: DBSession,
 ):
     """Get escalation contacts."""
-    return current_clinic.escalation_contacts
+    return await _cached_settings(
+        current_user.clinic_id, "escalation", db, lambda clinic: clinic.escalation_contacts
+    )
 
 
 @router.put("/escalation")
@@ -117,5 +158,7 @@ async def update_escalation_contacts(
     """Update escalation contacts."""
     current_clinic.escalation_contacts = [c.model_dump() for c in contacts]
     await db.commit()
+    settings_cache.invalidate(current_clinic.id)
+    invalidate_clinic_lookups()
 
     return current_clinic.escalation_contacts
@@ -1,24 +1,74 @@
 """Webhook handlers for external services."""
 
+import base64
 import hashlib
 import hmac
 import logging
-from typing import Optional
+import uuid
+from urllib.parse import parse_qsl
 
-from fastapi import APIRouter, Depends, HTTPException, Request, Response, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, Response, Query
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.api.twiml import EMPTY_TWIML, FALLBACK_MESSAGE, twiml_response
+from app.database import get_db, get_session_maker
 from app.config import settings
 from app.models import Clinic
+from app.services.clinic_lookup import get_clinic_by_whatsapp
 from app.services.whatsapp.engine import ConversationEngine
+from app.services.whatsapp.sender import whatsapp_sender
 
 router = APIRouter(prefix="/webhooks", tags=["webhooks"])
 logger = logging.getLogger(__name__)
 
+# Plain acknowledgement body. Response objects themselves are not shared:
+# middleware (e.g. CORS) mutates a response's header list in place.
+OK_BODY = b"OK"
 
-@router.get("/whatsapp")
+# Twilio webhook payloads are small urlencoded forms; anything larger is rejected
+MAX_TWILIO_FORM_BYTES = 32 * 1024
+
+# Status callbacks only need a handful of leading fields
+MAX_STATUS_FORM_BYTES = 4096
+
+
+async def _read_twilio_form(
+    request: Request,
+    max_bytes: int = MAX_TWILIO_FORM_BYTES,
+    truncate: bool = False
+) -> dict[str, str]:
+    """
+    Read a Twilio urlencoded webhook body, bypassing Starlette's form parser.
+
+    The body is streamed and reading stops at ``max_bytes``: past that the
+    request is rejected with 413, or with ``truncate`` the fields read so
+    far are parsed and the rest is ignored.
+    """
+    content_length = request.headers.get("content-length")
+    if (
+        not truncate
+        and content_length
+        and content_length.isdigit()
+        and int(content_length) > max_bytes
+    ):
+        raise HTTPException(status_code=413, detail="Payload too large")
+
+    buffer = bytearray()
+    async for chunk in request.stream():
+        buffer += chunk
+        if len(buffer) > max_bytes:
+            if not truncate:
+                raise HTTPException(status_code=413, detail="Payload too large")
+            # Keep only complete key=value pairs
+            del buffer[max(buffer.rfind(b"&", 0, max_bytes + 1), 0):]
+            break
+
+    # Percent-escapes are decoded as UTF-8 by parse_qsl; the raw body is ASCII
+    return dict(parse_qsl(buffer.decode("latin-1"), keep_blank_values=True))
+
+
+@router.get("/whatsapp", response_class=Response, response_model=None)
 async def whatsapp_webhook_verify(
     request: Request,
 ):
@@ -28,12 +78,13 @@ async def whatsapp_webhook_verify(
     """
     # For Twilio, verification is done differently
     # This endpoint just needs to respond with 200
-    return Response(content="OK", status_code=200)
+    return Response(content=OK_BODY, media_type="text/plain")
 
 
-@router.post("/whatsapp")
+@router.post("/whatsapp", response_class=Response, response_model=None)
 async def whatsapp_webhook(
     request: Request,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -45,13 +96,13 @@ async def whatsapp_webhook(
     - Body: Message text
     - MessageSid: Unique message ID
     """
-    try:
-        # Parse form data from Twilio
-        form_data = await request.form()
+    # Parse form data from Twilio
+    form_data = await _read_twilio_form(request)
 
+    try:
         from_number = form_data.get("From", "")
         to_number = form_data.get("To", "")
-        body = form_data.get("Body", "")
+        body = form_data.get("Body", "")[:settings.whatsapp_max_body_chars]
         message_sid = form_data.get("MessageSid", "")
 
         # Log incoming message
@@ -59,62 +110,68 @@ async def whatsapp_webhook(
 
         # Extract phone number (remove whatsapp: prefix)
         phone = from_number.replace("whatsapp:", "").strip()
-        clinic_number = to_number.replace("whatsapp:", "").strip()
 
         if not phone or not body:
             logger.warning("Missing phone or body in webhook")
-            return Response(
-                content='<?xml version="1.0" encoding="UTF-8"?><Response></Response>',
-                media_type="application/xml"
-            )
+            return twiml_response(EMPTY_TWIML)
 
-        # Find clinic by WhatsApp number
-        clinic = await _get_clinic_by_whatsapp(db, clinic_number)
+        # Find clinic by WhatsApp number (normalized by the lookup)
+        clinic = await get_clinic_by_whatsapp(db, to_number)
 
         if not clinic:
-            logger.warning(f"No clinic found for WhatsApp number: {clinic_number}")
+            logger.warning(f"No clinic found for WhatsApp number: {to_number}")
             # Try to get default/first clinic for development
             result = await db.execute(select(Clinic).limit(1))
             clinic = result.scalar_one_or_none()
 
         if not clinic:
             logger.error("No clinic found to handle message")
-            return Response(
-                content='<?xml version="1.0" encoding="UTF-8"?><Response></Response>',
-                media_type="application/xml"
-            )
+            return twiml_response(EMPTY_TWIML)
 
-        # Process message through conversation engine
-        engine = ConversationEngine(db)
-        result = await engine.process_incoming_message(
-            clinic_id=clinic.id,
-            phone=phone,
-            message_text=body,
-            external_id=message_sid
+        # Process the message after responding so Twilio gets its TwiML
+        # right away instead of waiting on LLM calls and outbound sends
+        background_tasks.add_task(
+            _process_message, clinic.id, phone, body, message_sid
         )
 
-        logger.info(f"Conversation result: state={result.get('state')}, action={result.get('action')}")
-
         # Return TwiML response (empty - we send messages via API)
-        return Response(
-            content='<?xml version="1.0" encoding="UTF-8"?><Response></Response>',
-            media_type="application/xml"
-        )
+        return twiml_response(EMPTY_TWIML)
 
     except Exception as e:
         logger.exception(f"Error processing WhatsApp webhook: {e}")
         # Return empty TwiML to prevent Twilio retries
-        return Response(
-            content='<?xml version="1.0" encoding="UTF-8"?><Response></Response>',
-            media_type="application/xml"
-        )
-
-
-@router.post("/whatsapp/status")
-async def whatsapp_status_callback(
-    request: Request,
-    db: AsyncSession = Depends(get_db),
-):
+        return twiml_response(EMPTY_TWIML)
+
+
+async def _process_message(
+    clinic_id: uuid.UUID,
+    phone: str,
+    body: str,
+    message_sid: str
+) -> None:
+    """Run an incoming message through the conversation engine on its own session."""
+    session_maker = get_session_maker()
+    async with session_maker() as db:
+        try:
+            engine = ConversationEngine(db)
+            result = await engine.process_incoming_message(
+                clinic_id=clinic_id,
+                phone=phone,
+                message_text=body,
+                external_id=message_sid
+            )
+            logger.info(f"Conversation result: state={result.get('state')}, action={result.get('action')}")
+        except Exception as e:
+            await db.rollback()
+            logger.exception(f"Error processing WhatsApp message {message_sid}: {e}")
+            # The engine never got to reply; let the client know
+            result = await whatsapp_sender.send(phone, FALLBACK_MESSAGE)
+            if result["status"] in ("failed", "error"):
+                logger.error(f"Failed to send fallback reply for message {message_sid}")
+
+
+@router.post("/whatsapp/status", response_class=Response, response_model=None)
+async def whatsapp_status_callback(request: Request):
     """
     Handle WhatsApp message status callbacks from Twilio.
 
@@ -125,9 +182,9 @@ async def whatsapp_status_callback(
     - read
     - failed
     """
-    try:
-        form_data = await request.form()
+    form_data = await _read_twilio_form(request, MAX_STATUS_FORM_BYTES, truncate=True)
 
+    try:
         message_sid = form_data.get("MessageSid", "")
         status = form_data.get("MessageStatus", "")
         error_code = form_data.get("ErrorCode")
@@ -140,46 +197,11 @@ async def whatsapp_status_callback(
 
         # TODO: Update message status in database if needed
 
-        return Response(content="OK", status_code=200)
+        return Response(content=OK_BODY, media_type="text/plain")
 
     except Exception as e:
         logger.exception(f"Error processing status callback: {e}")
-        return Response(content="OK", status_code=200)
-
-
-async def _get_clinic_by_whatsapp(
-    db: AsyncSession,
-    whatsapp_number: str
-) -> Optional[Clinic]:
-    """Find clinic by WhatsApp number."""
-    # Try exact match first
-    result = await db.execute(
-        select(Clinic)
-        .where(Clinic.whatsapp_number == whatsapp_number)
-    )
-    clinic = result.scalar_one_or_none()
-
-    if clinic:
-        return clinic
-
-    # Try with different formats
-    # Remove + prefix
-    if whatsapp_number.startswith("+"):
-        number_no_plus = whatsapp_number[1:]
-        result = await db.execute(
-            select(Clinic)
-            .where(Clinic.whatsapp_number == number_no_plus)
-        )
-        clinic = result.scalar_one_or_none()
-        if clinic:
-            return clinic
-
-    # Try matching phone field
-    result = await db.execute(
-        select(Clinic)
-        .where(Clinic.phone == whatsapp_number)
-    )
-    return result.scalar_one_or_none()
+        return Response(content=OK_BODY, media_type="text/plain")
 
 
 def verify_twilio_signature(
@@ -193,18 +215,19 @@ def verify_twilio_signature(
         return True  # Skip verification if no auth token configured
 
     # Build the string to sign
-    s = url
-    for key in sorted(params.keys()):
-        s += key + params[key]
+    signed = url + "".join(key + params[key] for key in sorted(params))
 
     # Compute the signature
     computed = hmac.new(
         settings.twilio_auth_token.encode(),
-        s.encode(),
+        signed.encode(),
         hashlib.sha1
     ).digest()
 
-    import base64
-    computed_b64 = base64.b64encode(computed).decode()
+    # Compare raw digests rather than re-encoding ours to base64
+    try:
+        expected = base64.b64decode(signature, validate=True)
+    except ValueError:
+        return False
 
-    return hmac.compare_digest(computed_b64, signature)
+    return hmac.compare_digest(computed, expected)
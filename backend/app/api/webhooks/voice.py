@@ -7,12 +7,43 @@ from fastapi import APIRouter, Form, Depends, Response, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
+from app.api.twiml import EMPTY_TWIML, twiml_response
 from app.database import get_db
 from app.models import Clinic
 from app.agents.orchestrator import Orchestrator
 
 router = APIRouter()
 
+_OK_JSON = b'{"status":"ok"}'
+
+_UNAVAILABLE_TWIML = """<?xml version="1.0" encoding="UTF-8"?>
+<Response>
+    <Say voice="Polly.Mia-Neural" language="es-CO">
+        Lo sentimos, este número no está disponible. Por favor intente más tarde.
+    </Say>
+    <Hangup/>
+</Response>""".encode()
+
+_GATHER_RETRY_TWIML = """<?xml version="1.0" encoding="UTF-8"?>
+<Response>
+    <Gather input="speech" action="/webhooks/voice/gather?conversation_id={conversation_id}"
+            method="POST" language="es-CO" speechTimeout="auto" speechModel="phone_call">
+        <Say voice="Polly.Mia-Neural" language="es-CO">
+            Lo siento, no pude escucharlo. ¿Puede repetir por favor?
+        </Say>
+    </Gather>
+    <Redirect>/webhooks/voice/gather?conversation_id={conversation_id}</Redirect>
+</Response>""".format
+
+_TRANSFER_FAILED_TWIML = """<?xml version="1.0" encoding="UTF-8"?>
+<Response>
+    <Say voice="Polly.Mia-Neural" language="es-CO">
+        El doctor no pudo contestar. Le hemos enviado una alerta urgente y lo contactarán
+        en los próximos minutos. El número de emergencias de la clínica le será enviado por mensaje.
+    </Say>
+    <Hangup/>
+</Response>""".encode()
+
 
 async def get_clinic_by_called_number(
     to: str, db: AsyncSession
@@ -27,7 +58,7 @@ async def get_clinic_by_called_number(
     return result.scalar_one_or_none()
 
 
-@router.post("/incoming")
+@router.post("/incoming", response_class=Response, response_model=None)
 async def voice_incoming(
     CallSid: str = Form(...),
     From: str = Form(...),
@@ -40,14 +71,7 @@ async def voice_incoming(
 
     if not clinic:
         # Return a generic message if clinic not found
-        twiml = """<?xml version="1.0" encoding="UTF-8"?>
-<Response>
-    <Say voice="Polly.Mia-Neural" language="es-CO">
-        Lo sentimos, este número no está disponible. Por favor intente más tarde.
-    </Say>
-    <Hangup/>
-</Response>"""
-        return Response(content=twiml, media_type="application/xml")
+        return twiml_response(_UNAVAILABLE_TWIML)
 
     # Create orchestrator and handle call
     orchestrator = Orchestrator(db, clinic)
@@ -56,10 +80,10 @@ async def voice_incoming(
         caller_phone=From,
     )
 
-    return Response(content=twiml, media_type="application/xml")
+    return twiml_response(twiml)
 
 
-@router.post("/gather")
+@router.post("/gather", response_class=Response, response_model=None)
 async def voice_gather(
     conversation_id: UUID,
     CallSid: str = Form(...),
@@ -72,17 +96,7 @@ async def voice_gather(
     """Handle speech input from Twilio Gather."""
     if not SpeechResult:
         # No speech detected, prompt again
-        twiml = f"""<?xml version="1.0" encoding="UTF-8"?>
-<Response>
-    <Gather input="speech" action="/webhooks/voice/gather?conversation_id={conversation_id}"
-            method="POST" language="es-CO" speechTimeout="auto" speechModel="phone_call">
-        <Say voice="Polly.Mia-Neural" language="es-CO">
-            Lo siento, no pude escucharlo. ¿Puede repetir por favor?
-        </Say>
-    </Gather>
-    <Redirect>/webhooks/voice/gather?conversation_id={conversation_id}</Redirect>
-</Response>"""
-        return Response(content=twiml, media_type="application/xml")
+        return twiml_response(_GATHER_RETRY_TWIML(conversation_id=conversation_id).encode())
 
     # Get clinic
     clinic = await get_clinic_by_called_number(To, db)
@@ -97,7 +111,7 @@ async def voice_gather(
         caller_phone=From,
     )
 
-    return Response(content=twiml, media_type="application/xml")
+    return twiml_response(twiml)
 
 
 @router.post("/status")
@@ -114,7 +128,7 @@ async def voice_status(
     return {"status": "ok", "call_status": CallStatus}
 
 
-@router.post("/transfer-status")
+@router.post("/transfer-status", response_class=Response, response_model=None)
 async def transfer_status(
     CallSid: str = Form(...),
     DialCallStatus: str = Form(...),
@@ -124,24 +138,13 @@ async def transfer_status(
     """Handle transfer call status."""
     if DialCallStatus in ["no-answer", "busy", "failed"]:
         # Transfer failed, send alert
-        twiml = """<?xml version="1.0" encoding="UTF-8"?>
-<Response>
-    <Say voice="Polly.Mia-Neural" language="es-CO">
-        El doctor no pudo contestar. Le hemos enviado una alerta urgente y lo contactarán
-        en los próximos minutos. El número de emergencias de la clínica le será enviado por mensaje.
-    </Say>
-    <Hangup/>
-</Response>"""
-        return Response(content=twiml, media_type="application/xml")
+        return twiml_response(_TRANSFER_FAILED_TWIML)
 
     # Transfer successful
-    return Response(
-        content='<?xml version="1.0" encoding="UTF-8"?><Response/>',
-        media_type="application/xml",
-    )
+    return twiml_response(EMPTY_TWIML)
 
 
-@router.post("/transcription")
+@router.post("/transcription", response_class=Response, response_model=None)
 async def voice_transcription(
     TranscriptionSid: str = Form(...),
     TranscriptionText: str = Form(...),
@@ -151,4 +154,4 @@ async def voice_transcription(
 ):
     """Handle transcription callback (for async transcription)."""
     # Store transcription if needed
-    return {"status": "ok"}
+    return Response(content=_OK_JSON, media_type="application/json")
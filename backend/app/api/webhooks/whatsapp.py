@@ -1,37 +1,48 @@
 """Twilio WhatsApp webhooks."""
 
+import logging
 from typing import Optional
 
-from fastapi import APIRouter, Form, Depends, Response
+from fastapi import APIRouter, BackgroundTasks, Form, Depends, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 
-from app.database import get_db
+from app.api.twiml import EMPTY_TWIML, FALLBACK_MESSAGE, twiml_response
+from app.database import get_db, get_session_maker
 from app.models import Clinic
 from app.agents.orchestrator import Orchestrator
+from app.services.clinic_lookup import get_clinic_by_whatsapp
 from app.services.twilio_client import TwilioService
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
+
+twilio_service = TwilioService()
+
+_TEXT_ONLY_TWIML = """<?xml version="1.0" encoding="UTF-8"?>
+<Response>
+    <Message>
+        Gracias por tu mensaje. Por el momento solo puedo procesar texto.
+        ¿En qué puedo ayudarte?
+    </Message>
+</Response>""".encode()
+
+_FALLBACK_TWIML = f"""<?xml version="1.0" encoding="UTF-8"?>
+<Response>
+    <Message>{FALLBACK_MESSAGE}</Message>
+</Response>""".encode()
 
 
 async def get_clinic_by_whatsapp_number(
     to: str, db: AsyncSession
 ) -> Optional[Clinic]:
     """Get clinic by WhatsApp number."""
-    # Remove whatsapp: prefix if present
-    phone = to.replace("whatsapp:", "").strip()
-
-    # Try whatsapp_number first, then regular phone
-    result = await db.execute(
-        select(Clinic).where(
-            (Clinic.whatsapp_number == phone) | (Clinic.phone == phone)
-        )
-    )
-    return result.scalar_one_or_none()
+    # Cached; normalizes to digits itself, so the whatsapp: prefix can stay
+    return await get_clinic_by_whatsapp(db, to)
 
 
-@router.post("/incoming")
+@router.post("/incoming", response_class=Response, response_model=None)
 async def whatsapp_incoming(
+    background_tasks: BackgroundTasks,
     MessageSid: str = Form(...),
     From: str = Form(...),
     To: str = Form(...),
@@ -48,38 +59,48 @@ async def whatsapp_incoming(
 
     if not clinic:
         # Return empty TwiML - message won't be replied to
-        return Response(
-            content='<?xml version="1.0" encoding="UTF-8"?><Response/>',
-            media_type="application/xml",
-        )
+        return twiml_response(EMPTY_TWIML)
 
     # Handle media messages
     if NumMedia > 0:
         # For now, we don't process media
-        twiml = """<?xml version="1.0" encoding="UTF-8"?>
-<Response>
-    <Message>
-        Gracias por tu mensaje. Por el momento solo puedo procesar texto.
-        ¿En qué puedo ayudarte?
-    </Message>
-</Response>"""
-        return Response(content=twiml, media_type="application/xml")
-
-    # Process message
-    orchestrator = Orchestrator(db, clinic)
-    response_message = await orchestrator.handle_whatsapp_message(
-        message_sid=MessageSid,
-        sender_phone=sender_phone,
-        message_body=Body,
-    )
+        return twiml_response(_TEXT_ONLY_TWIML)
 
-    # Return TwiML response
-    twiml = f"""<?xml version="1.0" encoding="UTF-8"?>
-<Response>
-    <Message>{response_message}</Message>
-</Response>"""
+    # Reply through the REST API once processed, so Twilio isn't kept
+    # waiting (and retrying) on the orchestrator
+    background_tasks.add_task(
+        _process_message, clinic, MessageSid, sender_phone, Body
+    )
 
-    return Response(content=twiml, media_type="application/xml")
+    return twiml_response(EMPTY_TWIML)
+
+
+async def _process_message(
+    clinic: Clinic,
+    message_sid: str,
+    sender_phone: str,
+    body: str,
+) -> None:
+    """Run an incoming message through the orchestrator on its own session and send the reply."""
+    session_maker = get_session_maker()
+    async with session_maker() as db:
+        try:
+            # The request session is gone; re-attach the (loaded) clinic
+            clinic = await db.merge(clinic, load=False)
+            orchestrator = Orchestrator(db, clinic)
+            response_message = await orchestrator.handle_whatsapp_message(
+                message_sid=message_sid,
+                sender_phone=sender_phone,
+                message_body=body,
+            )
+        except Exception as e:
+            await db.rollback()
+            logger.exception(f"Error processing WhatsApp message {message_sid}: {e}")
+            # Still answer, or the client is left waiting on a reply that never comes
+            response_message = FALLBACK_MESSAGE
+
+    if not await twilio_service.send_whatsapp(to=sender_phone, message=response_message):
+        logger.error(f"Failed to send WhatsApp reply for message {message_sid}")
 
 
 @router.post("/status")
@@ -88,7 +109,6 @@ async def whatsapp_status(
     MessageStatus: str = Form(...),
     To: str = Form(None),
     ErrorCode: str = Form(None),
-    db: AsyncSession = Depends(get_db),
 ):
     """Handle WhatsApp message status updates."""
     # Log status for analytics
@@ -96,29 +116,20 @@ async def whatsapp_status(
 
     if MessageStatus in ["failed", "undelivered"]:
         # Log error for review
-        print(f"WhatsApp message {MessageSid} failed: {ErrorCode}")
+        logger.warning(f"WhatsApp message {MessageSid} failed: {ErrorCode}")
 
     return {"status": "ok", "message_status": MessageStatus}
 
 
-@router.post("/fallback")
+@router.post("/fallback", response_class=Response, response_model=None)
 async def whatsapp_fallback(
     MessageSid: str = Form(None),
     From: str = Form(None),
     Body: str = Form(None),
     ErrorCode: str = Form(None),
-    db: AsyncSession = Depends(get_db),
 ):
     """Fallback handler for webhook errors."""
     # Log the error
-    print(f"WhatsApp fallback triggered: {ErrorCode}")
-
-    twiml = """<?xml version="1.0" encoding="UTF-8"?>
-<Response>
-    <Message>
-        Lo sentimos, estamos experimentando dificultades técnicas.
-        Por favor intenta de nuevo más tarde o llama directamente a la clínica.
-    </Message>
-</Response>"""
+    logger.error(f"WhatsApp fallback triggered: {ErrorCode}")
 
-    return Response(content=twiml, media_type="application/xml")
+    return twiml_response(_FALLBACK_TWIML)
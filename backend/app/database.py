@@ -2,28 +2,19 @@
 
 import asyncio
 import logging
-from typing import Optional
+import os
+import random
+import time
+import uuid
+from typing import Any, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker, AsyncEngine
 from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy import text
+from sqlalchemy.pool import NullPool
+from sqlalchemy import Executable, Row, text
 
-print("[DATABASE] Loading database module...")
 from app.config import settings
 
-# Show what DATABASE_URL we're using (hide password)
-if settings.database_url:
-    url_parts = settings.database_url.split("@")
-    if len(url_parts) > 1:
-        host_info = url_parts[-1]
-        scheme = settings.database_url.split("://")[0]
-        print(f"[DATABASE] URL scheme: {scheme}")
-        print(f"[DATABASE] URL host: {host_info}")
-    else:
-        print(f"[DATABASE] URL appears to be default/local")
-else:
-    print("[DATABASE] WARNING: database_url is empty!")
-
 logger = logging.getLogger(__name__)
 
 
@@ -32,12 +23,23 @@ class Base(DeclarativeBase):
     pass
 
 
+def uuid7() -> uuid.UUID:
+    """Generate a time-ordered UUID (RFC 9562 version 7) for primary keys.
+
+    The leading 48 bits are the Unix time in milliseconds, so new rows land
+    at the right edge of the primary key (and FK) indexes instead of on
+    random pages as with uuid4; the remaining bits are random.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = value & ~(0xF << 76) | 0x7 << 76  # version 7
+    value = value & ~(0x3 << 62) | 0x2 << 62  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
 # Global engine and session maker - initialized lazily
 _engine: Optional[AsyncEngine] = None
 _async_session_maker: Optional[async_sessionmaker[AsyncSession]] = None
 
-print("[DATABASE] Module loaded, engine not yet created (lazy)")
-
 
 def _get_database_url() -> str:
     """
@@ -49,32 +51,59 @@ def _get_database_url() -> str:
     # Handle Railway's postgres:// format
     if url.startswith("postgres://"):
         url = url.replace("postgres://", "postgresql+asyncpg://", 1)
-        print(f"[DATABASE] Converted postgres:// to postgresql+asyncpg://")
     elif url.startswith("postgresql://") and "+asyncpg" not in url:
         url = url.replace("postgresql://", "postgresql+asyncpg://", 1)
-        print(f"[DATABASE] Converted postgresql:// to postgresql+asyncpg://")
-    else:
-        print(f"[DATABASE] URL scheme is already correct")
 
     return url
 
 
+def _pool_options() -> dict[str, Any]:
+    """Engine pooling arguments for the configured db_pool_mode."""
+    if settings.db_pool_mode == "pgbouncer":
+        # PgBouncer does the pooling. In transaction mode a session's server
+        # connection changes between transactions, so asyncpg must not rely
+        # on prepared statements surviving: no caching, and unique names.
+        return {
+            "poolclass": NullPool,
+            "connect_args": {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+            },
+        }
+
+    return {
+        "pool_pre_ping": True,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": 1800,
+        # Reuse the most recently returned connection so idle ones can age out
+        "pool_use_lifo": True,
+        # Per-connection cache of server-side prepared statements (default
+        # 100); sized past the number of distinct queries, as query_cache_size
+        "connect_args": {"prepared_statement_cache_size": 256},
+    }
+
+
 def get_engine() -> AsyncEngine:
     """Get or create the async engine (lazy initialization)."""
     global _engine
     if _engine is None:
-        print("[DATABASE] Creating async engine...")
         database_url = _get_database_url()
+        if not database_url:
+            logger.warning("DATABASE_URL is empty")
         _engine = create_async_engine(
             database_url,
             echo=settings.database_echo,
-            pool_pre_ping=True,
-            pool_size=5,
-            max_overflow=10,
-            pool_timeout=30,
-            pool_recycle=1800,
+            # Compiled-SQL cache (default 500); room for every distinct ORM query
+            query_cache_size=1200,
+            **_pool_options(),
+        )
+        logger.info(
+            f"Database engine created ({settings.db_pool_mode} pool): "
+            f"{_engine.url.render_as_string(hide_password=True)}"
         )
-        print("[DATABASE] Engine created (connection not yet tested)")
     return _engine
 
 
@@ -102,41 +131,74 @@ async def get_db() -> AsyncSession:
             await session.close()
 
 
-async def wait_for_db(max_retries: int = 5, initial_delay: float = 2.0) -> bool:
-    """Wait for database to be available with exponential backoff.
+async def execute_scalar(statement: Executable) -> Any:
+    """Execute a scalar query on its own pooled session.
+
+    A single AsyncSession cannot run statements concurrently; this lets
+    independent read queries (e.g. counts) be overlapped with asyncio.gather.
+    """
+    session_maker = get_session_maker()
+    async with session_maker() as session:
+        result = await session.execute(statement)
+        return result.scalar()
+
+
+async def execute_one(statement: Executable) -> Row:
+    """Execute a single-row query on its own pooled session.
+
+    Row counterpart of execute_scalar, for concurrent multi-column reads.
+    """
+    session_maker = get_session_maker()
+    async with session_maker() as session:
+        result = await session.execute(statement)
+        return result.one()
+
+
+async def _ping(engine: AsyncEngine) -> None:
+    """Open a connection and run a trivial query."""
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+
+async def wait_for_db(
+    max_retries: int = 5,
+    initial_delay: float = 2.0,
+    max_delay: float = 30.0,
+    attempt_timeout: float = 5.0,
+) -> bool:
+    """Wait for database to be available with jittered exponential backoff.
     
     Args:
         max_retries: Maximum number of connection attempts
         initial_delay: Initial delay between retries in seconds
+        max_delay: Upper bound for the delay between retries in seconds
+        attempt_timeout: Time limit for each connection attempt in seconds
         
     Returns:
         True if connection successful, False otherwise
     """
-    print(f"[DATABASE] wait_for_db called, max_retries={max_retries}")
     engine = get_engine()
     delay = initial_delay
     
     for attempt in range(1, max_retries + 1):
         try:
-            print(f"[DATABASE] Connection attempt {attempt}/{max_retries}...")
-            async with engine.connect() as conn:
-                await conn.execute(text("SELECT 1"))
-                print(f"[DATABASE] Connection SUCCESS on attempt {attempt}")
-                logger.info(f"Database connection successful on attempt {attempt}")
-                return True
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Database connection attempt {attempt}/{max_retries}")
+            # A hung connect must not stall startup for the driver's own timeout
+            await asyncio.wait_for(_ping(engine), timeout=attempt_timeout)
+            logger.info(f"Database connection successful on attempt {attempt}")
+            return True
         except Exception as e:
-            print(f"[DATABASE] Connection FAILED on attempt {attempt}: {type(e).__name__}: {e}")
             if attempt < max_retries:
-                print(f"[DATABASE] Waiting {delay:.1f}s before retry...")
                 logger.warning(
-                    f"Database connection attempt {attempt}/{max_retries} failed: {e}. "
+                    f"Database connection attempt {attempt}/{max_retries} failed: {e!r}. "
                     f"Retrying in {delay:.1f}s..."
                 )
                 await asyncio.sleep(delay)
-                delay *= 2  # Exponential backoff
+                # Decorrelated jitter so restarting workers don't retry in lockstep
+                delay = min(max_delay, random.uniform(initial_delay, delay * 2))
             else:
-                print(f"[DATABASE] All {max_retries} attempts FAILED")
-                logger.error(f"Database connection failed after {max_retries} attempts: {e}")
+                logger.error(f"Database connection failed after {max_retries} attempts: {e!r}")
                 return False
     
     return False
@@ -144,19 +206,15 @@ async def wait_for_db(max_retries: int = 5, initial_delay: float = 2.0) -> bool:
 
 async def init_db():
     """Initialize database connection and tables."""
-    print("[DATABASE] init_db() called")
     # Wait for database to be available
     if not await wait_for_db():
-        print("[DATABASE] CRITICAL: Could not connect to database!")
         raise RuntimeError("Could not connect to database after multiple retries")
     
     # Create tables if they don't exist
-    print("[DATABASE] Creating tables...")
     engine = get_engine()
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     
-    print("[DATABASE] Database initialized successfully!")
     logger.info("Database initialized successfully")
 
 
@@ -167,7 +225,6 @@ async def close_db():
         await _engine.dispose()
         _engine = None
         _async_session_maker = None
-        print("[DATABASE] Connections closed")
         logger.info("Database connections closed")
 
 
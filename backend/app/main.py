@@ -1,43 +1,59 @@
 """FastAPI application entry point."""
 
-print("=" * 50)
-print("VETASSIST STARTING - Deploy version 2026-02-03 v5")
-print("=" * 50)
-
+import asyncio
+import logging
+import time
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+import orjson
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.orm import configure_mappers
 
-print("[STARTUP] Importing settings...")
 from app.config import settings
-print(f"[STARTUP] Settings loaded, environment: {settings.environment}")
-
-print("[STARTUP] Importing database...")
 from app.database import init_db, close_db
-print("[STARTUP] Database module imported")
-
+from app.services import emergency_cache
+from app.services.message_partitions import ensure_message_partitions, run_partition_maintenance
+from app.services.otp_cleanup import run_otp_cleanup
 from app.api.v1.router import api_router
 from app.api.webhooks import webhooks_router
-print("[STARTUP] All imports complete")
+
+logging.basicConfig(
+    level=logging.DEBUG if settings.debug else logging.INFO,
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+)
+logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events."""
     # Startup
-    print("[LIFESPAN] Starting database initialization...")
+    logger.info(
+        f"Starting {settings.app_name} {settings.app_version} "
+        f"(environment: {settings.environment})"
+    )
+    # Resolve relationships now rather than on the first request's query
+    configure_mappers()
     try:
         await init_db()
-        print("[LIFESPAN] Database initialized successfully!")
+        # create_all leaves a fresh conversation_messages without partitions,
+        # and no message can be stored until they exist
+        await ensure_message_partitions()
     except Exception as e:
-        print(f"[LIFESPAN] Database init FAILED: {e}")
+        logger.critical(f"Database init failed: {e}")
         raise
+    await emergency_cache.start_listener()
+    otp_cleanup = asyncio.create_task(run_otp_cleanup())
+    partition_maintenance = asyncio.create_task(run_partition_maintenance())
     yield
     # Shutdown
-    print("[LIFESPAN] Shutting down, closing database...")
+    logger.info("Shutting down")
+    otp_cleanup.cancel()
+    partition_maintenance.cancel()
+    await emergency_cache.stop_listener()
     await close_db()
-    print("[LIFESPAN] Shutdown complete")
 
 
 app = FastAPI(
@@ -45,6 +61,7 @@ app = FastAPI(
     version=settings.app_version,
     description="AI Receptionist and Smart Scheduling for Veterinary Clinics",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
@@ -60,27 +77,48 @@ app.add_middleware(
 app.include_router(api_router, prefix=settings.api_v1_prefix)
 app.include_router(webhooks_router, prefix="/webhooks")
 
-print("[STARTUP] FastAPI app configured, ready to start!")
+
+# Load balancers probe /health every few seconds on every worker; the DB
+# check result is reused briefly so probes can't add up to pool pressure
+HEALTH_CACHE_TTL = 5.0
+HEALTH_PROBE_TIMEOUT = 1.0
+
+# (monotonic time checked, (db_status, db_error))
+_health_cache: tuple[float, tuple[str, str | None]] = (0.0, ("unknown", None))
+_health_lock = asyncio.Lock()
+
+
+async def _database_status() -> tuple[str, str | None]:
+    """Check the database, reusing a recent result; concurrent probes share one check."""
+    global _health_cache
+    from sqlalchemy import text
+    from app.database import get_engine
+
+    async with _health_lock:
+        checked_at, result = _health_cache
+        if time.monotonic() - checked_at < HEALTH_CACHE_TTL:
+            return result
+
+        async def ping():
+            async with get_engine().connect() as conn:
+                await conn.execute(text("SELECT 1"))
+
+        try:
+            await asyncio.wait_for(ping(), HEALTH_PROBE_TIMEOUT)
+            result = ("connected", None)
+        except Exception as e:
+            result = ("disconnected", str(e) or type(e).__name__)
+
+        _health_cache = (time.monotonic(), result)
+        return result
 
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint with database status."""
     from datetime import datetime
-    from sqlalchemy import text
 
-    db_status = "unknown"
-    db_error = None
-
-    try:
-        from app.database import get_engine
-        engine = get_engine()
-        async with engine.connect() as conn:
-            await conn.execute(text("SELECT 1"))
-        db_status = "connected"
-    except Exception as e:
-        db_status = "disconnected"
-        db_error = str(e)
+    db_status, db_error = await _database_status()
 
     # Get DB URL info (hide password)
     db_host = "unknown"
@@ -103,12 +141,16 @@ async def health_check():
     }
 
 
-@app.get("/")
+# Settings are fixed for the process, so the root body is serialized once
+_ROOT_JSON = orjson.dumps({
+    "name": settings.app_name,
+    "version": settings.app_version,
+    "docs": "/docs",
+})
+
+
+@app.get("/", response_class=Response)
 async def root():
     """Root endpoint."""
-    return {
-        "name": settings.app_name,
-        "version": settings.app_version,
-        "docs": "/docs",
-    }
+    return Response(content=_ROOT_JSON, media_type="application/json")
 
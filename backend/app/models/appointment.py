@@ -2,13 +2,18 @@
 
 import uuid
 from datetime import datetime
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy import DateTime, FetchedValue, ForeignKey, Integer, String, Text, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.database import Base
+from app.database import Base, uuid7
+
+if TYPE_CHECKING:
+    from app.models.clinic import Clinic, Staff
+    from app.models.client import Client, Pet
+    from app.models.follow_up import FollowUp
 
 
 class Appointment(Base):
@@ -17,7 +22,7 @@ class Appointment(Base):
     __tablename__ = "appointments"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     clinic_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("clinics.id", ondelete="CASCADE"), nullable=False
@@ -66,8 +71,9 @@ class Appointment(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
+    # Bumped by the touch_updated_at trigger (migration 015)
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+        DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue()
     )
 
     # Relationships
@@ -76,11 +82,6 @@ class Appointment(Base):
     pet: Mapped[Optional["Pet"]] = relationship("Pet", back_populates="appointments")
     staff: Mapped[Optional["Staff"]] = relationship("Staff", back_populates="appointments")
     follow_ups: Mapped[list["FollowUp"]] = relationship(
-        "FollowUp", back_populates="appointment", cascade="all, delete-orphan"
+        "FollowUp", back_populates="appointment", cascade="all, delete-orphan",
+        passive_deletes=True
     )
-
-
-# Import for type hints
-from app.models.clinic import Clinic, Staff
-from app.models.client import Client, Pet
-from app.models.follow_up import FollowUp
@@ -2,13 +2,20 @@
 
 import uuid
 from datetime import datetime
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, Text, UniqueConstraint, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.database import Base
+from app.database import Base, uuid7
+
+if TYPE_CHECKING:
+    from app.models.clinic import Clinic
+    from app.models.appointment import Appointment
+    from app.models.conversation import Conversation
+    from app.models.emergency import EmergencyEvent
+    from app.models.follow_up import FollowUp
 
 
 class Client(Base):
@@ -17,7 +24,7 @@ class Client(Base):
     __tablename__ = "clients"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     clinic_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("clinics.id", ondelete="CASCADE"), nullable=False
@@ -42,7 +49,8 @@ class Client(Base):
     # Relationships
     clinic: Mapped["Clinic"] = relationship("Clinic", back_populates="clients")
     pets: Mapped[list["Pet"]] = relationship(
-        "Pet", back_populates="client", cascade="all, delete-orphan"
+        "Pet", back_populates="client", cascade="all, delete-orphan",
+        passive_deletes=True
     )
     appointments: Mapped[list["Appointment"]] = relationship(
         "Appointment", back_populates="client"
@@ -64,7 +72,7 @@ class Pet(Base):
     __tablename__ = "pets"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     client_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("clients.id", ondelete="CASCADE"), nullable=False
@@ -86,11 +94,3 @@ class Pet(Base):
     follow_ups: Mapped[list["FollowUp"]] = relationship(
         "FollowUp", back_populates="pet"
     )
-
-
-# Import for type hints
-from app.models.clinic import Clinic
-from app.models.appointment import Appointment
-from app.models.conversation import Conversation
-from app.models.emergency import EmergencyEvent
-from app.models.follow_up import FollowUp
@@ -2,12 +2,16 @@
 
 import uuid
 from datetime import datetime
+from typing import TYPE_CHECKING
 
 from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.database import Base
+from app.database import Base, uuid7
+
+if TYPE_CHECKING:
+    from app.models.clinic import Clinic
 
 
 class ClientOTP(Base):
@@ -16,9 +20,9 @@ class ClientOTP(Base):
     __tablename__ = "client_otps"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
-    phone: Mapped[str] = mapped_column(String(20), nullable=False, index=True)
+    phone: Mapped[str] = mapped_column(String(20), nullable=False)
     clinic_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("clinics.id", ondelete="CASCADE"), nullable=False
     )
@@ -32,7 +36,3 @@ class ClientOTP(Base):
 
     # Relationships
     clinic: Mapped["Clinic"] = relationship("Clinic")
-
-
-# Import for type hints
-from app.models.clinic import Clinic
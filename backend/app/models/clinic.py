@@ -2,13 +2,20 @@
 
 import uuid
 from datetime import datetime
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String, Text, func
+from sqlalchemy import Boolean, Computed, DateTime, FetchedValue, ForeignKey, String, Text, func
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.database import Base
+from app.database import Base, uuid7
+
+if TYPE_CHECKING:
+    from app.models.client import Client
+    from app.models.appointment import Appointment
+    from app.models.conversation import Conversation
+    from app.models.emergency import EmergencyEvent
+    from app.models.follow_up import FollowUpProtocol, FollowUp
 
 
 class Clinic(Base):
@@ -17,11 +24,21 @@ class Clinic(Base):
     __tablename__ = "clinics"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     phone: Mapped[str] = mapped_column(String(20), nullable=False, unique=True)
+    # Digits-only form of phone, maintained by Postgres
+    phone_e164: Mapped[Optional[str]] = mapped_column(
+        String(20),
+        Computed("NULLIF(regexp_replace(phone, '[^0-9]', '', 'g'), '')", persisted=True),
+    )
     whatsapp_number: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
+    # Digits-only form of whatsapp_number, maintained by Postgres
+    whatsapp_number_e164: Mapped[Optional[str]] = mapped_column(
+        String(20),
+        Computed("NULLIF(regexp_replace(whatsapp_number, '[^0-9]', '', 'g'), '')", persisted=True),
+    )
     timezone: Mapped[str] = mapped_column(String(50), default="America/Bogota")
 
     working_hours: Mapped[dict] = mapped_column(
@@ -55,31 +72,43 @@ class Clinic(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
+    # Bumped by the touch_updated_at trigger (migration 015)
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+        DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue()
     )
 
-    # Relationships
+    # Relationships. The per-clinic collections grow without bound and are
+    # never loaded whole; lazy="raise" makes an accidental access fail loudly
+    # instead of pulling every row (query them with a filter instead).
+    # passive_deletes leaves removing them to the ON DELETE CASCADE foreign
+    # keys, so deleting a clinic is a single DELETE
     staff: Mapped[list["Staff"]] = relationship(
-        "Staff", back_populates="clinic", cascade="all, delete-orphan"
+        "Staff", back_populates="clinic", cascade="all, delete-orphan",
+        passive_deletes=True, lazy="raise",
     )
     clients: Mapped[list["Client"]] = relationship(
-        "Client", back_populates="clinic", cascade="all, delete-orphan"
+        "Client", back_populates="clinic", cascade="all, delete-orphan",
+        passive_deletes=True, lazy="raise",
     )
     appointments: Mapped[list["Appointment"]] = relationship(
-        "Appointment", back_populates="clinic", cascade="all, delete-orphan"
+        "Appointment", back_populates="clinic", cascade="all, delete-orphan",
+        passive_deletes=True, lazy="raise",
     )
     conversations: Mapped[list["Conversation"]] = relationship(
-        "Conversation", back_populates="clinic", cascade="all, delete-orphan"
+        "Conversation", back_populates="clinic", cascade="all, delete-orphan",
+        passive_deletes=True, lazy="raise",
     )
     emergency_events: Mapped[list["EmergencyEvent"]] = relationship(
-        "EmergencyEvent", back_populates="clinic", cascade="all, delete-orphan"
+        "EmergencyEvent", back_populates="clinic", cascade="all, delete-orphan",
+        passive_deletes=True, lazy="raise",
     )
     follow_up_protocols: Mapped[list["FollowUpProtocol"]] = relationship(
-        "FollowUpProtocol", back_populates="clinic", cascade="all, delete-orphan"
+        "FollowUpProtocol", back_populates="clinic", cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     follow_ups: Mapped[list["FollowUp"]] = relationship(
-        "FollowUp", back_populates="clinic", cascade="all, delete-orphan"
+        "FollowUp", back_populates="clinic", cascade="all, delete-orphan",
+        passive_deletes=True, lazy="raise",
     )
 
 
@@ -89,7 +118,7 @@ class Staff(Base):
     __tablename__ = "staff"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     clinic_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("clinics.id", ondelete="CASCADE"), nullable=False
@@ -111,11 +140,3 @@ class Staff(Base):
     appointments: Mapped[list["Appointment"]] = relationship(
         "Appointment", back_populates="staff"
     )
-
-
-# Import for type hints
-from app.models.client import Client
-from app.models.appointment import Appointment
-from app.models.conversation import Conversation
-from app.models.emergency import EmergencyEvent
-from app.models.follow_up import FollowUpProtocol, FollowUp
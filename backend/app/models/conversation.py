@@ -2,22 +2,42 @@
 
 import uuid
 from datetime import datetime
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import DateTime, Float, ForeignKey, String, Text, func
+from sqlalchemy import DateTime, Float, ForeignKey, Index, String, Text, func, text
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.database import Base
+from app.database import Base, uuid7
+
+if TYPE_CHECKING:
+    from app.models.clinic import Clinic
+    from app.models.client import Client
+    from app.models.emergency import EmergencyEvent
+    from app.models.follow_up import FollowUp
+
+# Predicate of the partial unique index on active WhatsApp conversations.
+# Every INSERT ... ON CONFLICT targeting that index has to repeat it for
+# Postgres to infer the index.
+ACTIVE_WHATSAPP_CONVERSATION = text("status = 'active' AND channel = 'whatsapp'")
 
 
 class Conversation(Base):
     """Conversation model representing AI interaction sessions."""
 
     __tablename__ = "conversations"
+    # One active WhatsApp conversation per phone (migration 010). Declared
+    # here too because the ON CONFLICT inserts need it, so create_all
+    # databases have it as well
+    __table_args__ = (
+        Index(
+            "idx_conversations_active_whatsapp_phone", "clinic_id", "client_phone",
+            unique=True, postgresql_where=ACTIVE_WHATSAPP_CONVERSATION,
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     clinic_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("clinics.id", ondelete="CASCADE"), nullable=False
@@ -81,9 +101,15 @@ class Conversation(Base):
 
     # Relationships
     clinic: Mapped["Clinic"] = relationship("Clinic", back_populates="conversations")
-    client: Mapped[Optional["Client"]] = relationship("Client", back_populates="conversations")
+    # Many-to-one: selectin loading auto-applies omit_join, issuing a plain
+    # ``clients.id IN (...)`` lookup instead of joining back through conversations.
+    client: Mapped[Optional["Client"]] = relationship(
+        "Client", back_populates="conversations", lazy="selectin"
+    )
     messages: Mapped[list["ConversationMessage"]] = relationship(
-        "ConversationMessage", back_populates="conversation", cascade="all, delete-orphan"
+        "ConversationMessage", back_populates="conversation", cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",  # load with selectinload() where the history is needed
     )
     emergency_event: Mapped[Optional["EmergencyEvent"]] = relationship(
         "EmergencyEvent", back_populates="conversation", uselist=False
@@ -97,9 +123,14 @@ class ConversationMessage(Base):
     """Individual message within a conversation."""
 
     __tablename__ = "conversation_messages"
+    # Monthly range partitions (migration 016, app.services.message_partitions).
+    # Postgres requires the partition key in the primary key; the ORM keeps
+    # identifying rows by id alone.
+    __table_args__ = {"postgresql_partition_by": "RANGE (created_at)"}
+    __mapper_args__ = {"primary_key": ["id"]}
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     conversation_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -116,17 +147,10 @@ class ConversationMessage(Base):
     )
 
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now()
+        DateTime(timezone=True), primary_key=True, server_default=func.now()
     )
 
     # Relationships
     conversation: Mapped["Conversation"] = relationship(
         "Conversation", back_populates="messages"
     )
-
-
-# Import for type hints
-from app.models.clinic import Clinic
-from app.models.client import Client
-from app.models.emergency import EmergencyEvent
-from app.models.follow_up import FollowUp
@@ -8,7 +8,7 @@ from sqlalchemy import DateTime, String, Text, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.database import Base
+from app.database import Base, uuid7
 
 
 class DemoRequest(Base):
@@ -17,7 +17,7 @@ class DemoRequest(Base):
     __tablename__ = "demo_requests"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     clinic_name: Mapped[str] = mapped_column(String(255), nullable=False)
     contact_name: Mapped[str] = mapped_column(String(255), nullable=False)
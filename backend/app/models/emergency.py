@@ -2,13 +2,18 @@
 
 import uuid
 from datetime import datetime
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from sqlalchemy import DateTime, ForeignKey, String, Text, func
 from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.database import Base
+from app.database import Base, uuid7
+
+if TYPE_CHECKING:
+    from app.models.clinic import Clinic, Staff
+    from app.models.client import Client
+    from app.models.conversation import Conversation
 
 
 class EmergencyEvent(Base):
@@ -17,7 +22,7 @@ class EmergencyEvent(Base):
     __tablename__ = "emergency_events"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     clinic_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("clinics.id", ondelete="CASCADE"), nullable=False
@@ -71,7 +76,9 @@ class EmergencyEvent(Base):
     )
     client: Mapped[Optional["Client"]] = relationship("Client", back_populates="emergency_events")
     alerts: Mapped[list["EmergencyAlert"]] = relationship(
-        "EmergencyAlert", back_populates="emergency", cascade="all, delete-orphan"
+        "EmergencyAlert", back_populates="emergency", cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",  # load with selectinload() where the alerts are needed
     )
 
 
@@ -81,7 +88,7 @@ class EmergencyAlert(Base):
     __tablename__ = "emergency_alerts"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     emergency_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("emergency_events.id", ondelete="CASCADE"), nullable=False
@@ -114,9 +121,3 @@ class EmergencyAlert(Base):
     emergency: Mapped["EmergencyEvent"] = relationship(
         "EmergencyEvent", back_populates="alerts"
     )
-
-
-# Import for type hints
-from app.models.clinic import Clinic, Staff
-from app.models.client import Client
-from app.models.conversation import Conversation
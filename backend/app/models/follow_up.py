@@ -2,13 +2,19 @@
 
 import uuid
 from datetime import datetime
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy import Boolean, DateTime, FetchedValue, ForeignKey, Integer, String, Text, func
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.database import Base
+from app.database import Base, uuid7
+
+if TYPE_CHECKING:
+    from app.models.clinic import Clinic
+    from app.models.client import Client, Pet
+    from app.models.appointment import Appointment
+    from app.models.conversation import Conversation
 
 
 class FollowUpProtocol(Base):
@@ -17,7 +23,7 @@ class FollowUpProtocol(Base):
     __tablename__ = "follow_up_protocols"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     clinic_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("clinics.id", ondelete="CASCADE"), nullable=False
@@ -48,8 +54,9 @@ class FollowUpProtocol(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
+    # Bumped by the touch_updated_at trigger (migration 015)
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+        DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue()
     )
 
     # Relationships
@@ -65,7 +72,7 @@ class FollowUp(Base):
     __tablename__ = "follow_ups"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     clinic_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("clinics.id", ondelete="CASCADE"), nullable=False
@@ -125,7 +132,9 @@ class FollowUp(Base):
         "Conversation", back_populates="follow_up"
     )
     responses: Mapped[list["FollowUpResponse"]] = relationship(
-        "FollowUpResponse", back_populates="follow_up", cascade="all, delete-orphan"
+        "FollowUpResponse", back_populates="follow_up", cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",  # load with selectinload() where the responses are needed
     )
 
 
@@ -135,7 +144,7 @@ class FollowUpResponse(Base):
     __tablename__ = "follow_up_responses"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     follow_up_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("follow_ups.id", ondelete="CASCADE"), nullable=False
@@ -168,10 +177,3 @@ class FollowUpResponse(Base):
     # Relationships
     follow_up: Mapped["FollowUp"] = relationship("FollowUp", back_populates="responses")
     conversation: Mapped[Optional["Conversation"]] = relationship("Conversation")
-
-
-# Import for type hints
-from app.models.clinic import Clinic
-from app.models.client import Client, Pet
-from app.models.appointment import Appointment
-from app.models.conversation import Conversation
@@ -1,5 +1,10 @@
 """Emergency detection and response prompts."""
 
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Optional
+
 EMERGENCY_DETECTION_PROMPT = """
 Eres un sistema de triaje para emergencias veterinarias.
 Analiza el mensaje y determina si es una emergencia médica para la mascota.
@@ -65,6 +70,30 @@ Responde en español colombiano, de manera clara y tranquilizadora.
 No uses jerga médica complicada.
 """
 
+EMERGENCY_CONTEXT_TEMPLATE = """
+Nivel de urgencia: {urgency_level}
+Síntomas reportados: {symptoms}
+Canal: {channel}
+"""
+
+
+@lru_cache(maxsize=512)
+def build_emergency_context(
+    urgency_level: str,
+    symptoms: tuple[str, ...],
+    channel: str,
+) -> str:
+    """User message for EMERGENCY_RESPONSE_PROMPT.
+
+    Cached so repeated triage contexts reuse the same string.
+    """
+    return EMERGENCY_CONTEXT_TEMPLATE.format_map({
+        "urgency_level": urgency_level,
+        "symptoms": ", ".join(symptoms) if symptoms else "No especificados",
+        "channel": channel,
+    })
+
+
 TRIAGE_QUESTIONS = {
     "breathing": "¿Puede respirar normalmente?",
     "consciousness": "¿Está consciente y responde?",
@@ -82,3 +111,70 @@ FIRST_AID_TIPS = {
     "poisoning": "No lo haga vomitar sin consultar primero. Traiga el envase del producto si es posible.",
     "choking": "No introduzca los dedos en la boca. Traiga al animal inmediatamente.",
 }
+
+# CRITICAL signs from EMERGENCY_DETECTION_PROMPT, lowercase and without
+# accents, phrased as something happening to the pet right now. Only phrases
+# that are an emergency on their own belong here; bare topics ("veneno",
+# "convulsiones", "atropello") also show up in questions, negations and past
+# events, and are left to the LLM.
+CRITICAL_KEYWORDS = (
+    "no respira", "no puede respirar", "dificultad para respirar",
+    "le cuesta respirar", "se esta ahogando",
+    "sangrado abundante", "sangra mucho", "esta sangrando mucho",
+    "esta convulsionando",
+    "esta inconsciente", "perdio el conocimiento", "perdio la consciencia",
+)
+# Matched as prefixes, for the inflections of a present-state phrase
+# ("esta desmayado", "esta desmayada")
+CRITICAL_STEMS = ("esta desmayad",)
+
+# One alternation compiled at import: a single linear scan per sentence.
+# Keywords match whole words only, so "no respira" doesn't catch the past
+# "no respiraba"
+_CRITICAL_PATTERN = re.compile(
+    r"\b(?:" + "|".join(re.escape(keyword) for keyword in CRITICAL_KEYWORDS) + r")\b"
+    r"|\b(?:" + "|".join(re.escape(stem) for stem in CRITICAL_STEMS) + r")\w*"
+)
+
+_SENTENCE = re.compile(r"[^.!?\n]+[.!?]*")
+_CLAUSE_BREAK = re.compile(r"[,;:]|\bpero\b")
+# Before a sign in the same clause, these make it negated ("ya no tiene
+# dificultad para respirar"), hypothetical ("si no respira") or averted
+_QUALIFIER = re.compile(r"\b(?:no|ni|nunca|tampoco|sin|si|casi)\b")
+
+
+def _fold(text: str) -> str:
+    """Lowercase and strip accents ("Convulsión" -> "convulsion")."""
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def _critical_matches(text: str) -> list[str]:
+    """Critical signs stated as facts: questions and qualified clauses skipped."""
+    matches = []
+    for sentence in _SENTENCE.findall(_fold(text)):
+        if "?" in sentence or "\u00bf" in sentence:
+            continue
+        for match in _CRITICAL_PATTERN.finditer(sentence):
+            clause_start = 0
+            for brk in _CLAUSE_BREAK.finditer(sentence, 0, match.start()):
+                clause_start = brk.end()
+            if not _QUALIFIER.search(sentence, clause_start, match.start()):
+                matches.append(match.group())
+    return matches
+
+
+def fast_triage(text: str) -> Optional[str]:
+    """Return "critical" if the message states a critical sign, else None.
+
+    A miss means "not obviously critical", not "no emergency": callers
+    still run the LLM triage in that case.
+    """
+    if _critical_matches(text):
+        return "critical"
+    return None
+
+
+def critical_symptoms(text: str) -> list[str]:
+    """Critical signs found in the message (accents stripped), once each."""
+    return list(dict.fromkeys(_critical_matches(text)))
@@ -1,29 +1,28 @@
 """Scheduling conversation prompts."""
 
 
-def get_scheduling_prompt(current_state: str, channel: str) -> str:
-    """Get the appropriate scheduling prompt for the current state."""
-    base_context = """
+_BASE_CONTEXT = """
 Eres el asistente virtual de una clínica veterinaria en Colombia.
 Tu tarea es ayudar a agendar citas de manera natural y amigable.
 Hablas español colombiano (informal pero profesional).
 """
 
-    if channel == "voice":
-        tone_instruction = """
+# "voice" for phone calls; every other channel gets the text tone
+_TONE_INSTRUCTIONS = {
+    "voice": """
 Tus respuestas deben ser concisas y claras para llamadas telefónicas.
 No uses emojis ni formato especial.
 Máximo 2-3 oraciones por respuesta.
-"""
-    else:
-        tone_instruction = """
+""",
+    "text": """
 Puedes usar emojis moderadamente para WhatsApp.
 Usa viñetas o listas para opciones múltiples.
 Sé conversacional pero eficiente.
-"""
+""",
+}
 
-    state_instructions = {
-        "collect_info": """
+_STATE_INSTRUCTIONS = {
+    "collect_info": """
 Necesitas recopilar la siguiente información:
 - Tipo de mascota (perro, gato, otro)
 - Motivo de la consulta
@@ -31,12 +30,12 @@ Necesitas recopilar la siguiente información:
 
 Pregunta UNA cosa a la vez. Si ya tienes algunos datos, pregunta por lo que falta.
 """,
-        "propose_slots": """
+    "propose_slots": """
 Tienes horarios disponibles para ofrecer.
 Presenta máximo 3 opciones de manera clara.
 Pregunta cuál prefiere el usuario.
 """,
-        "confirm_booking": """
+    "confirm_booking": """
 Confirma los detalles de la cita antes de finalizarla:
 - Fecha y hora
 - Tipo de cita
@@ -44,14 +43,26 @@ Confirma los detalles de la cita antes de finalizarla:
 
 Pide confirmación explícita.
 """,
-        "greeting": """
+    "greeting": """
 Da la bienvenida y pregunta en qué puedes ayudar.
 """,
-    }
+    # Any other state
+    None: "Continúa la conversación de manera natural.",
+}
+
+# Every (state, tone) combination, assembled once at import
+_SCHEDULING_PROMPTS = {
+    (state, tone): f"{_BASE_CONTEXT}\n{tone_instruction}\n{instruction}"
+    for state, instruction in _STATE_INSTRUCTIONS.items()
+    for tone, tone_instruction in _TONE_INSTRUCTIONS.items()
+}
 
-    instruction = state_instructions.get(current_state, "Continúa la conversación de manera natural.")
 
-    return f"{base_context}\n{tone_instruction}\n{instruction}"
+def get_scheduling_prompt(current_state: str, channel: str) -> str:
+    """Get the appropriate scheduling prompt for the current state."""
+    tone = "voice" if channel == "voice" else "text"
+    prompt = _SCHEDULING_PROMPTS.get((current_state, tone))
+    return prompt if prompt is not None else _SCHEDULING_PROMPTS[(None, tone)]
 
 
 SCHEDULING_RESPONSES = {
@@ -3,7 +3,7 @@
 from datetime import date, datetime, time
 from typing import Optional
 from uuid import UUID
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class TimeSlot(BaseModel):
@@ -72,8 +72,7 @@ class AppointmentResponse(BaseModel):
     pet_species: Optional[str] = None
     staff_name: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class AvailableSlotsRequest(BaseModel):
@@ -1,8 +1,9 @@
 """Client authentication schemas for OTP-based login."""
 
+from datetime import datetime
 from typing import Optional
 from uuid import UUID
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class OTPRequest(BaseModel):
@@ -52,8 +53,7 @@ class ClientInfo(BaseModel):
     clinic_id: UUID
     clinic_name: str
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PetInfo(BaseModel):
@@ -64,8 +64,7 @@ class PetInfo(BaseModel):
     species: str
     breed: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class AppointmentInfo(BaseModel):
@@ -74,14 +73,13 @@ class AppointmentInfo(BaseModel):
     id: UUID
     pet_name: Optional[str] = None
     pet_species: Optional[str] = None
-    scheduled_at: str
+    scheduled_at: datetime
     duration_minutes: int
     reason: Optional[str] = None
     status: str
     notes: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ClinicInfo(BaseModel):
@@ -92,8 +90,7 @@ class ClinicInfo(BaseModel):
     phone: Optional[str] = None
     address: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PortalChatMessage(BaseModel):
@@ -3,7 +3,7 @@
 from datetime import time
 from typing import Optional
 from uuid import UUID
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class WorkingHours(BaseModel):
@@ -61,8 +61,7 @@ class ClinicResponse(ClinicBase):
     escalation_contacts: list
     settings: dict
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class StaffBase(BaseModel):
@@ -99,5 +98,4 @@ class StaffResponse(StaffBase):
     clinic_id: UUID
     calendar_id: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Optional
 from uuid import UUID
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ConversationMessageResponse(BaseModel):
@@ -16,8 +16,7 @@ class ConversationMessageResponse(BaseModel):
     transcription_confidence: Optional[float] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ConversationResponse(BaseModel):
@@ -40,8 +39,7 @@ class ConversationResponse(BaseModel):
     client_phone: Optional[str] = None
     message_count: int = 0
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ConversationState(BaseModel):
@@ -52,8 +50,8 @@ class ConversationState(BaseModel):
     channel: str
     current_state: str
     intent: Optional[str] = None
-    collected_data: dict = {}
-    messages: list[dict] = []
+    collected_data: dict = Field(default_factory=dict)
+    messages: list[dict] = Field(default_factory=list)
 
 
 class ConversationSummary(BaseModel):
@@ -255,11 +255,9 @@ IMPORTANTE:
         """Generate a response for emergency situations."""
         system_prompt = emergency_prompts.EMERGENCY_RESPONSE_PROMPT
 
-        context = f"""
-Nivel de urgencia: {urgency_level}
-Síntomas reportados: {', '.join(symptoms) if symptoms else 'No especificados'}
-Canal: {channel}
-"""
+        context = emergency_prompts.build_emergency_context(
+            urgency_level, tuple(symptoms or ()), channel
+        )
 
         response = await self._call_gpt(
             system_prompt=system_prompt,
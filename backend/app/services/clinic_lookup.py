@@ -0,0 +1,116 @@
+"""Clinic lookup by inbound phone number (webhook hot path)."""
+
+import re
+from typing import Optional
+
+from sqlalchemy import bindparam, lambda_stmt, literal, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
+
+from app.config import settings
+from app.database import get_session_maker
+from app.models import Clinic
+from app.services.cache import TTLCache
+
+_NON_DIGITS = re.compile(r"\D")
+
+# Columns the webhook handlers and the agents they drive read from the clinic
+# (orchestrator, scheduling/calendar, escalation, notifications). Anything
+# else (settings, timestamps) is left unloaded and must not be touched on a
+# looked-up clinic: a lazy load on a detached/async instance fails.
+_LOOKUP_COLUMNS = (
+    Clinic.id,
+    Clinic.name,
+    Clinic.phone,
+    Clinic.whatsapp_number,
+    Clinic.timezone,
+    Clinic.working_hours,
+    Clinic.appointment_duration_minutes,
+    Clinic.escalation_contacts,
+)
+
+# normalized whatsapp number -> detached Clinic with _LOOKUP_COLUMNS loaded.
+# Hits are merged into the caller's session with load=False, so they cost no
+# query at all; misses are not cached so new clinics show up at once.
+_clinic_by_whatsapp: TTLCache[Clinic] = TTLCache(maxsize=1024, ttl=300)
+
+
+def invalidate_clinic_lookups() -> None:
+    """Drop cached lookups (call whenever a clinic is updated).
+
+    Per-process only: other workers pick up changes within the TTL.
+    """
+    _clinic_by_whatsapp.clear()
+
+
+def normalize_number(number: str) -> str:
+    """Reduce a phone number to its digits (E.164 without the leading +)."""
+    return _NON_DIGITS.sub("", number)
+
+
+async def get_clinic_by_whatsapp(
+    db: AsyncSession,
+    whatsapp_number: str
+) -> Optional[Clinic]:
+    """Find clinic by WhatsApp number (any format, "whatsapp:" prefix included)."""
+    number = normalize_number(whatsapp_number)
+    if not number:
+        return None
+
+    clinic = _clinic_by_whatsapp.get(number)
+    if clinic is None:
+        # Load on a short-lived session so the cached instance is detached
+        # and never shared with (or mutated by) a request session
+        session_maker = get_session_maker()
+        async with session_maker() as lookup_db:
+            clinic = await _lookup_clinic_by_whatsapp(lookup_db, number)
+        if clinic is None:
+            return None
+        _clinic_by_whatsapp.set(number, clinic)
+
+    return await db.merge(clinic, load=False)
+
+
+def _lookup_by_number():
+    return (
+        select(Clinic)
+        .options(load_only(*_LOOKUP_COLUMNS))
+        .where(Clinic.whatsapp_number_e164 == bindparam("number"))
+        .limit(1)
+    )
+
+
+def _lookup_by_number_or_phone():
+    # Two indexed point lookups rather than an OR the planner has
+    # to combine; rank prefers a whatsapp_number match over a phone match
+    matches = union_all(
+        select(Clinic.id, literal(0).label("rank"))
+        .where(Clinic.whatsapp_number_e164 == bindparam("number")),
+        select(Clinic.id, literal(1).label("rank"))
+        .where(Clinic.phone_e164 == bindparam("number")),
+    ).subquery()
+    return (
+        select(Clinic)
+        .options(load_only(*_LOOKUP_COLUMNS))
+        .join(matches, matches.c.id == Clinic.id)
+        .order_by(matches.c.rank)
+        .limit(1)
+    )
+
+
+# Built once and cached by code location, so a lookup only binds
+# parameters instead of reconstructing the statement
+_LOOKUP_BY_NUMBER = lambda_stmt(_lookup_by_number)
+_LOOKUP_BY_NUMBER_OR_PHONE = lambda_stmt(_lookup_by_number_or_phone)
+
+
+async def _lookup_clinic_by_whatsapp(
+    db: AsyncSession,
+    number: str
+) -> Optional[Clinic]:
+    """Query the clinic by normalized WhatsApp number (or, optionally, phone)."""
+    if settings.whatsapp_match_clinic_phone:
+        result = await db.execute(_LOOKUP_BY_NUMBER_OR_PHONE, {"number": number})
+    else:
+        result = await db.execute(_LOOKUP_BY_NUMBER, {"number": number})
+    return result.scalar_one_or_none()
@@ -4,13 +4,21 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import select, desc
+from sqlalchemy import func, insert, select, desc
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 from sqlalchemy.orm.attributes import flag_modified
 
 from app.models import Conversation, ConversationMessage, Client
+from app.models.conversation import ACTIVE_WHATSAPP_CONVERSATION
 from app.schemas.conversation import ConversationState
 
+# Conversation lookups here only need the row itself: skips
+# Conversation.client's default selectin query, and any relationship access
+# raises instead of issuing a hidden query
+_ROW_ONLY = raiseload("*")
+
 
 class ConversationService:
     """Service for managing conversation state and history."""
@@ -70,10 +78,57 @@ class ConversationService:
 
         return conversation
 
+    async def get_or_create_active_conversation(
+        self,
+        clinic_id: UUID,
+        channel: str,
+        client_phone: str,
+        external_id: Optional[str] = None,
+    ) -> Conversation:
+        """Get the client's active conversation, creating it if there is none.
+
+        A single INSERT ... ON CONFLICT against the partial unique index on
+        active WhatsApp conversations (migration 010), so concurrent first
+        messages from the same number can't open two conversations.
+        """
+        client_id = (
+            select(Client.id)
+            .where(Client.clinic_id == clinic_id, Client.phone == client_phone)
+            .limit(1)
+            .scalar_subquery()
+        )
+
+        stmt = pg_insert(Conversation).values(
+            clinic_id=clinic_id,
+            client_id=client_id,
+            client_phone=client_phone,
+            channel=channel,
+            external_id=external_id,
+            status="active",
+            conversation_metadata={"current_state": self.STATE_GREETING, "collected_data": {}},
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Conversation.clinic_id, Conversation.client_phone],
+            index_where=ACTIVE_WHATSAPP_CONVERSATION,
+            # Link the client if they registered since the conversation began
+            set_={"client_id": func.coalesce(Conversation.client_id, stmt.excluded.client_id)},
+        ).returning(Conversation)
+
+        result = await self.db.execute(
+            select(Conversation).from_statement(stmt).options(_ROW_ONLY),
+            execution_options={"populate_existing": True},
+        )
+        conversation = result.scalar_one()
+        await self.db.commit()
+
+        return conversation
+
     async def get_conversation(self, conversation_id: UUID) -> Optional[Conversation]:
         """Get conversation by ID."""
         result = await self.db.execute(
-            select(Conversation).where(Conversation.id == conversation_id)
+            select(Conversation)
+            .options(_ROW_ONLY)
+            .where(Conversation.id == conversation_id)
         )
         return result.scalar_one_or_none()
 
@@ -83,6 +138,7 @@ class ConversationService:
         """Get conversation by external ID (Twilio SID)."""
         result = await self.db.execute(
             select(Conversation)
+            .options(_ROW_ONLY)
             .where(Conversation.external_id == external_id)
             .order_by(desc(Conversation.started_at))
         )
@@ -94,6 +150,7 @@ class ConversationService:
         """Get active conversation for a client."""
         result = await self.db.execute(
             select(Conversation)
+            .options(_ROW_ONLY)
             .join(Client, Conversation.client_id == Client.id)
             .where(
                 Conversation.clinic_id == clinic_id,
@@ -128,6 +185,28 @@ class ConversationService:
 
         return message
 
+    async def add_messages(
+        self,
+        conversation_id: UUID,
+        messages: list[dict],
+    ) -> None:
+        """Add several messages to the conversation in one INSERT.
+
+        Each message dict holds ConversationMessage fields (role, content,
+        ...). Pass created_at explicitly: rows inserted together would
+        otherwise share the transaction's now() and lose their order.
+        """
+        if not messages:
+            return
+
+        rows = [{"conversation_id": conversation_id, **m} for m in messages]
+        await self.db.execute(
+            insert(ConversationMessage)
+            .values(rows)
+            .execution_options(synchronize_session=False)
+        )
+        await self.db.commit()
+
     async def get_messages(
         self, conversation_id: UUID, limit: int = 50
     ) -> list[ConversationMessage]:
@@ -0,0 +1,32 @@
+"""Emergency access of clients who raise false alarms."""
+
+from uuid import UUID
+
+from sqlalchemy import case, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Client
+
+# False alarms after which a client loses access to the emergency flow
+FALSE_EMERGENCY_LIMIT = 2
+
+
+async def register_false_emergency(db: AsyncSession, client_id: UUID) -> None:
+    """Count a false alarm for the client, revoking access once the limit is reached.
+
+    Done in a single UPDATE: no SELECT, and concurrent requests can't
+    overwrite each other's count.
+    """
+    new_count = Client.false_emergency_count + 1
+    await db.execute(
+        update(Client)
+        .where(Client.id == client_id)
+        .values(
+            false_emergency_count=new_count,
+            emergency_access_revoked=case(
+                (new_count >= FALSE_EMERGENCY_LIMIT, True),
+                else_=Client.emergency_access_revoked,
+            ),
+        )
+        .execution_options(synchronize_session=False)
+    )
@@ -0,0 +1,121 @@
+"""Per-process cache of the dashboard's active-emergencies payload.
+
+Entries are invalidated through Postgres LISTEN/NOTIFY: a trigger on
+``emergency_events`` (migration 005) notifies ``emergency_change`` with the
+clinic id on every insert, update or delete. Caching is only enabled while
+the listener connection is up and the trigger is installed, so a missing
+listener degrades to "no cache" rather than to stale data.
+"""
+
+import logging
+import uuid
+from typing import Optional
+
+import asyncpg
+from sqlalchemy import text
+
+from app.config import settings
+from app.database import get_engine
+from app.services.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "emergency_change"
+TRIGGER_NAME = "emergency_events_notify"
+
+# clinic_id -> (etag, serialized JSON body); the TTL is only a safety net
+_cache: TTLCache[tuple[str, bytes]] = TTLCache(maxsize=1024, ttl=60)
+
+# Bumped on every invalidation so an in-flight fill can't store stale data
+_versions: dict[uuid.UUID, int] = {}
+
+_listener = None
+
+
+def is_enabled() -> bool:
+    """Whether invalidations are being received and caching is safe."""
+    return _listener is not None and not _listener.is_closed()
+
+
+def get(clinic_id: uuid.UUID) -> Optional[tuple[str, bytes]]:
+    """Get the cached (etag, body) for a clinic, if any."""
+    if not is_enabled():
+        return None
+    return _cache.get(clinic_id)
+
+
+def version(clinic_id: uuid.UUID) -> int:
+    """Current invalidation version for a clinic (take before querying)."""
+    return _versions.get(clinic_id, 0)
+
+
+def store(clinic_id: uuid.UUID, snapshot: int, etag: str, body: bytes) -> None:
+    """Cache a payload unless the clinic was invalidated since ``snapshot``."""
+    if is_enabled() and version(clinic_id) == snapshot:
+        _cache.set(clinic_id, (etag, body))
+
+
+def invalidate(clinic_id: uuid.UUID) -> None:
+    """Drop a clinic's cached payload."""
+    _versions[clinic_id] = version(clinic_id) + 1
+    _cache.pop(clinic_id)
+
+
+def _invalidate_all() -> None:
+    for clinic_id in list(_versions):
+        _versions[clinic_id] += 1
+    _cache.clear()
+
+
+def _on_notify(connection, pid, channel, payload) -> None:
+    try:
+        invalidate(uuid.UUID(payload))
+    except ValueError:
+        _invalidate_all()
+
+
+def _on_terminate(connection) -> None:
+    logger.warning("Emergency change listener connection lost; cache disabled")
+    _invalidate_all()
+
+
+async def start_listener() -> None:
+    """Open a dedicated connection and LISTEN for emergency changes."""
+    global _listener
+    if settings.db_pool_mode == "pgbouncer":
+        # LISTEN needs a session-pinned connection, which transaction
+        # pooling doesn't provide
+        logger.info("Emergency change listener unavailable behind PgBouncer; cache disabled")
+        return
+
+    engine = get_engine()
+
+    try:
+        async with engine.connect() as conn:
+            result = await conn.execute(
+                text("SELECT 1 FROM pg_trigger WHERE tgname = :name"),
+                {"name": TRIGGER_NAME},
+            )
+            if result.scalar() is None:
+                logger.info("Emergency change trigger not installed; cache disabled")
+                return
+
+        dsn = engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+        listener = await asyncpg.connect(dsn)
+        await listener.add_listener(CHANNEL, _on_notify)
+        listener.add_termination_listener(_on_terminate)
+    except Exception as e:
+        logger.warning(f"Could not start emergency change listener: {e}")
+        return
+
+    _listener = listener
+    logger.info("Emergency change listener started")
+
+
+async def stop_listener() -> None:
+    """Close the listener connection and drop cached payloads."""
+    global _listener
+    if _listener is not None:
+        await _listener.close()
+        _listener = None
+    _invalidate_all()
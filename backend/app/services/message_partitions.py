@@ -0,0 +1,105 @@
+"""Monthly partitions of ``conversation_messages`` (migration 016).
+
+The table is range-partitioned by ``created_at``; each month lives in its
+own ``conversation_messages_YYYY_MM`` table, so indexes and vacuum work stay
+proportional to recent traffic and an old month can be dropped whole. This
+keeps partitions created a few months ahead. A DEFAULT partition catches
+anything outside them, but it is meant to stay empty: a new month can't be
+created while the default holds rows in its range.
+"""
+
+import asyncio
+import logging
+from datetime import date, datetime, timezone
+
+from sqlalchemy import text
+
+from app.database import get_engine
+
+logger = logging.getLogger(__name__)
+
+TABLE = "conversation_messages"
+DEFAULT_PARTITION = f"{TABLE}_default"
+
+CHECK_INTERVAL_SECONDS = 86400
+# A failed check is retried soon: missing a month sends its rows to DEFAULT
+RETRY_INTERVAL_SECONDS = 60
+MONTHS_AHEAD = 2
+
+
+def month_start(day: date, months: int = 0) -> date:
+    """First day of the month ``months`` after the one containing ``day``."""
+    index = day.year * 12 + day.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    """Name of the partition holding ``month``."""
+    return f"{TABLE}_{month:%Y_%m}"
+
+
+async def ensure_message_partitions(months_ahead: int = MONTHS_AHEAD) -> list[str]:
+    """Create any missing partitions up to ``months_ahead``; returns their names."""
+    this_month = month_start(datetime.now(timezone.utc).date())
+    months = [month_start(this_month, i) for i in range(months_ahead + 1)]
+
+    created = []
+    async with get_engine().begin() as conn:
+        partitioned = await conn.scalar(text(
+            "SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(:table)"
+        ), {"table": TABLE})
+        if partitioned is None:
+            return created
+
+        # Every worker runs this at startup: they take turns, and the ones
+        # after the first find its partitions committed
+        await conn.execute(text(
+            "SELECT pg_advisory_xact_lock(hashtext(:table))"
+        ), {"table": TABLE})
+
+        existing = set((await conn.execute(text(
+            "SELECT relname FROM pg_class "
+            "WHERE relnamespace = to_regnamespace(current_schema()) AND relname LIKE :prefix"
+        ), {"prefix": f"{TABLE}\\_%"})).scalars())
+
+        # Creating a partition briefly locks the parent: give up rather than
+        # stall message writes behind a long-running query
+        await conn.execute(text("SET LOCAL lock_timeout = '5s'"))
+
+        if DEFAULT_PARTITION not in existing:
+            await conn.execute(text(
+                f"CREATE TABLE IF NOT EXISTS {DEFAULT_PARTITION} PARTITION OF {TABLE} DEFAULT"
+            ))
+            created.append(DEFAULT_PARTITION)
+
+        for month in months:
+            name = partition_name(month)
+            if name in existing:
+                continue
+            await conn.execute(text(
+                f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {TABLE} "
+                f"FOR VALUES FROM ('{month} 00:00+00') TO ('{month_start(month, 1)} 00:00+00')"
+            ))
+            created.append(name)
+
+    return created
+
+
+async def run_partition_maintenance(
+    interval: float = CHECK_INTERVAL_SECONDS,
+    retry_interval: float = RETRY_INTERVAL_SECONDS,
+) -> None:
+    """Keep future partitions in place every ``interval`` seconds until cancelled.
+
+    A failed check is retried every ``retry_interval`` seconds until it succeeds.
+    """
+    while True:
+        try:
+            created = await ensure_message_partitions()
+            if created:
+                logger.info(f"Created message partitions: {', '.join(created)}")
+        except Exception as e:
+            logger.warning(f"Message partition maintenance failed: {e}")
+            await asyncio.sleep(retry_interval)
+            continue
+        await asyncio.sleep(interval)
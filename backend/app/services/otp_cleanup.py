@@ -0,0 +1,43 @@
+"""Periodic purge of expired client OTP codes."""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete
+
+from app.database import get_session_maker
+from app.models.client_otp import ClientOTP
+
+logger = logging.getLogger(__name__)
+
+PURGE_INTERVAL_SECONDS = 3600
+
+# Expired codes are kept a little while for support/debugging
+EXPIRED_RETENTION = timedelta(days=1)
+
+
+async def purge_expired_otps() -> int:
+    """Delete OTPs that expired more than EXPIRED_RETENTION ago; returns the count."""
+    cutoff = datetime.now(timezone.utc) - EXPIRED_RETENTION
+    session_maker = get_session_maker()
+    async with session_maker() as db:
+        result = await db.execute(
+            delete(ClientOTP)
+            .where(ClientOTP.expires_at < cutoff)
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+    return result.rowcount
+
+
+async def run_otp_cleanup(interval: float = PURGE_INTERVAL_SECONDS) -> None:
+    """Purge expired OTPs every ``interval`` seconds until cancelled."""
+    while True:
+        try:
+            purged = await purge_expired_otps()
+            if purged:
+                logger.info(f"Purged {purged} expired OTP codes")
+        except Exception as e:
+            logger.warning(f"OTP purge failed: {e}")
+        await asyncio.sleep(interval)
@@ -0,0 +1,30 @@
+"""Per-process cache of serialized clinic settings responses."""
+
+import uuid
+from typing import Optional
+
+from app.services.cache import TTLCache
+
+# Response sections served by the GET /settings endpoints
+SECTIONS = ("all", "hours", "durations", "escalation")
+
+# (clinic_id, section) -> serialized JSON body. Bodies are immutable bytes so
+# one entry can be shared by concurrent requests; other workers may serve a
+# value up to the TTL old after an update.
+_cache: TTLCache[bytes] = TTLCache(maxsize=4096, ttl=60)
+
+
+def get(clinic_id: uuid.UUID, section: str) -> Optional[bytes]:
+    """Get a cached settings body for a clinic, if any."""
+    return _cache.get((clinic_id, section))
+
+
+def store(clinic_id: uuid.UUID, section: str, body: bytes) -> None:
+    """Cache a settings body for a clinic."""
+    _cache.set((clinic_id, section), body)
+
+
+def invalidate(clinic_id: uuid.UUID) -> None:
+    """Drop every cached settings section for a clinic."""
+    for section in SECTIONS:
+        _cache.pop((clinic_id, section))
@@ -1,14 +1,22 @@
 """Twilio client wrapper for voice and messaging."""
 
+import asyncio
+import logging
 from typing import Optional
 from twilio.rest import Client
 from twilio.twiml.voice_response import VoiceResponse, Gather
 
 from app.config import settings
 
+logger = logging.getLogger(__name__)
+
 
 class TwilioService:
-    """Service for Twilio voice and messaging operations."""
+    """Service for Twilio voice and messaging operations.
+
+    The Twilio REST client is synchronous, so API calls run in a worker
+    thread to keep the event loop free for other requests.
+    """
 
     def __init__(self):
         self.account_sid = settings.twilio_account_sid
@@ -100,24 +108,25 @@ class TwilioService:
     async def send_sms(self, to: str, message: str) -> bool:
         """Send an SMS message."""
         if not self.client:
-            print(f"[SMS Mock] To: {to}, Message: {message}")
+            logger.info(f"[SMS Mock] To: {to}, Message: {message}")
             return True
 
         try:
-            self.client.messages.create(
+            await asyncio.to_thread(
+                self.client.messages.create,
                 body=message,
                 from_=self.phone_number,
                 to=to,
             )
             return True
         except Exception as e:
-            print(f"SMS send error: {e}")
+            logger.error(f"SMS send error: {e}")
             return False
 
     async def send_whatsapp(self, to: str, message: str) -> bool:
         """Send a WhatsApp message."""
         if not self.client:
-            print(f"[WhatsApp Mock] To: {to}, Message: {message}")
+            logger.info(f"[WhatsApp Mock] To: {to}, Message: {message}")
             return True
 
         try:
@@ -125,31 +134,33 @@ class TwilioService:
             whatsapp_to = f"whatsapp:{to}" if not to.startswith("whatsapp:") else to
             whatsapp_from = f"whatsapp:{self.whatsapp_number}"
 
-            self.client.messages.create(
+            await asyncio.to_thread(
+                self.client.messages.create,
                 body=message,
                 from_=whatsapp_from,
                 to=whatsapp_to,
             )
             return True
         except Exception as e:
-            print(f"WhatsApp send error: {e}")
+            logger.error(f"WhatsApp send error: {e}")
             return False
 
     async def initiate_call(self, to: str, url: str) -> Optional[str]:
         """Initiate an outbound call."""
         if not self.client:
-            print(f"[Call Mock] To: {to}, URL: {url}")
+            logger.info(f"[Call Mock] To: {to}, URL: {url}")
             return "mock_call_sid"
 
         try:
-            call = self.client.calls.create(
+            call = await asyncio.to_thread(
+                self.client.calls.create,
                 url=url,
                 to=to,
                 from_=self.phone_number,
             )
             return call.sid
         except Exception as e:
-            print(f"Call initiate error: {e}")
+            logger.error(f"Call initiate error: {e}")
             return None
 
     def validate_request(
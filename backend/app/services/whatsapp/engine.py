@@ -6,27 +6,37 @@ from datetime import datetime, timedelta
 from typing import Optional
 
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import (
     Clinic, Client, Conversation, ConversationMessage,
     Appointment, EmergencyEvent, EmergencyAlert
 )
+from app.services.conversation import ACTIVE_WHATSAPP_CONVERSATION
+from app.services.emergency_access import register_false_emergency
 from app.services.whatsapp.states import (
     ConversationState, get_timeout_duration, can_transition, is_terminal_state
 )
-from app.services.whatsapp.intent import IntentClassifier, Intent
+from app.services.whatsapp.intent import Intent, intent_classifier
 from app.services.whatsapp.sender import whatsapp_sender
 
 logger = logging.getLogger(__name__)
 
+# Follow-up replies containing any of these are escalated to the vet
+CONCERNING_KEYWORDS = (
+    "sangre", "fiebre", "no come", "vomita", "peor",
+    "hinchado", "pus", "olor", "no mejora"
+)
+
 
 class ConversationEngine:
     """Main engine for processing WhatsApp conversations."""
 
     def __init__(self, db: AsyncSession):
+        # Per-request state is just the session; the classifier is shared
         self.db = db
-        self.intent_classifier = IntentClassifier()
+        self.intent_classifier = intent_classifier
 
     async def process_incoming_message(
         self,
@@ -114,20 +124,47 @@ class ConversationEngine:
             # Get or create client
             client = await self._get_or_create_client(clinic_id, phone)
 
-            # Create new conversation
-            conversation = Conversation(
-                clinic_id=clinic_id,
-                client_id=client.id if client else None,
-                client_phone=phone,
-                channel="whatsapp",
-                external_id=external_id,
-                conversation_type="inbound",
-                state=ConversationState.GREETING.value,
-                status="active",
-                started_at=datetime.utcnow()
-            )
-            self.db.add(conversation)
+            # Create new conversation. ON CONFLICT against the one-active-
+            # conversation-per-phone index (migration 010): if a concurrent
+            # message opened it first, use that one instead of failing.
+            # Flushed first so a timed-out conversation is closed before.
             await self.db.flush()
+            stmt = (
+                pg_insert(Conversation)
+                .values(
+                    clinic_id=clinic_id,
+                    client_id=client.id if client else None,
+                    client_phone=phone,
+                    channel="whatsapp",
+                    external_id=external_id,
+                    conversation_type="inbound",
+                    state=ConversationState.GREETING.value,
+                    status="active",
+                    started_at=datetime.utcnow()
+                )
+                .on_conflict_do_nothing(
+                    index_elements=[Conversation.clinic_id, Conversation.client_phone],
+                    index_where=ACTIVE_WHATSAPP_CONVERSATION,
+                )
+                .returning(Conversation)
+            )
+            result = await self.db.execute(
+                select(Conversation).from_statement(stmt),
+                execution_options={"populate_existing": True},
+            )
+            conversation = result.scalar_one_or_none()
+
+            if conversation is None:
+                result = await self.db.execute(
+                    select(Conversation)
+                    .where(
+                        Conversation.clinic_id == clinic_id,
+                        Conversation.client_phone == phone,
+                        Conversation.status == "active",
+                        Conversation.channel == "whatsapp"
+                    )
+                )
+                conversation = result.scalar_one()
 
         # Update timeout
         timeout = get_timeout_duration(ConversationState(conversation.state))
@@ -546,9 +583,7 @@ class ConversationEngine:
         if intent_result.intent == Intent.REJECTION:
             # Not a real emergency - redirect to scheduling
             if conversation.client_id:
-                client = await self.db.get(Client, conversation.client_id)
-                if client:
-                    client.false_emergency_count += 1
+                await register_false_emergency(self.db, conversation.client_id)
 
             await self._transition_state(conversation, ConversationState.ASK_REASON)
             return {
@@ -596,13 +631,8 @@ class ConversationEngine:
     ) -> dict:
         """Handle COLLECT_STATUS state - follow-up response."""
         # Analyze response for concerning keywords
-        concerning_keywords = [
-            "sangre", "fiebre", "no come", "vomita", "peor",
-            "hinchado", "pus", "olor", "no mejora"
-        ]
-
         message_lower = message.lower()
-        matched = [kw for kw in concerning_keywords if kw in message_lower]
+        matched = [kw for kw in CONCERNING_KEYWORDS if kw in message_lower]
 
         if matched:
             # Concerning response - notify vet
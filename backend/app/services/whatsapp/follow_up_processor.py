@@ -4,15 +4,22 @@ import logging
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import select
+from sqlalchemy import exists, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
-from app.models import FollowUp, Client, Pet, Conversation, ConversationMessage
+from app.models import Client, FollowUp, Conversation, ConversationMessage
+from app.services.conversation import ACTIVE_WHATSAPP_CONVERSATION
 from app.services.whatsapp.sender import whatsapp_sender
 from app.services.whatsapp.states import ConversationState
 
 logger = logging.getLogger(__name__)
 
+# An active conversation that hasn't timed out (the engine never times out
+# one without timeout_at): the client may be mid-booking
+_LIVE = or_(Conversation.timeout_at.is_(None), Conversation.timeout_at > func.now())
+
 
 class FollowUpProcessor:
     """Processes and sends scheduled follow-up messages."""
@@ -27,30 +34,53 @@ class FollowUpProcessor:
         """
         now = datetime.utcnow()
 
-        # Get pending follow-ups that are due
+        # A phone has at most one active WhatsApp conversation (migration
+        # 010): follow-ups for a client with a live one wait for it to end
+        # or time out, and are picked up by a later run
+        client_busy = exists().where(
+            Conversation.clinic_id == FollowUp.clinic_id,
+            Conversation.client_phone == Client.phone,
+            Conversation.status == "active",
+            Conversation.channel == "whatsapp",
+            _LIVE,
+        )
+
+        # Get pending follow-ups that are due, with clients and pets
+        # batch-loaded (one IN query each) instead of fetched per row
         result = await self.db.execute(
             select(FollowUp)
+            .outerjoin(Client, Client.id == FollowUp.client_id)
             .where(
                 FollowUp.status == "pending",
-                FollowUp.scheduled_at <= now
+                FollowUp.scheduled_at <= now,
+                ~client_busy
             )
             .order_by(FollowUp.scheduled_at)
             .limit(50)  # Process in batches
+            .options(selectinload(FollowUp.client), selectinload(FollowUp.pet))
         )
         follow_ups = result.scalars().all()
 
         sent = 0
         failed = 0
+        deferred = 0
 
         for follow_up in follow_ups:
+            follow_up_id = follow_up.id
             try:
-                success = await self._send_follow_up(follow_up)
-                if success:
+                # Savepoint per follow-up: a failed one is rolled back alone
+                # and doesn't stop the batch's final commit, which records the
+                # follow-ups already sent
+                async with self.db.begin_nested():
+                    success = await self._send_follow_up(follow_up)
+                if success is None:
+                    deferred += 1
+                elif success:
                     sent += 1
                 else:
                     failed += 1
             except Exception as e:
-                logger.exception(f"Error processing follow-up {follow_up.id}: {e}")
+                logger.exception(f"Error processing follow-up {follow_up_id}: {e}")
                 follow_up.status = "failed"
                 follow_up.error_message = str(e)
                 failed += 1
@@ -60,13 +90,13 @@ class FollowUpProcessor:
         return {
             "processed": len(follow_ups),
             "sent": sent,
-            "failed": failed
+            "failed": failed,
+            "deferred": deferred
         }
 
-    async def _send_follow_up(self, follow_up: FollowUp) -> bool:
-        """Send a single follow-up message."""
-        # Get client
-        client = await self.db.get(Client, follow_up.client_id)
+    async def _send_follow_up(self, follow_up: FollowUp) -> Optional[bool]:
+        """Send a single follow-up message; None if deferred (left pending)."""
+        client = follow_up.client
         if not client:
             follow_up.status = "failed"
             follow_up.error_message = "Client not found"
@@ -74,24 +104,57 @@ class FollowUpProcessor:
 
         # Format message with pet name if available
         message = follow_up.message_template
-        if follow_up.pet_id:
-            pet = await self.db.get(Pet, follow_up.pet_id)
-            if pet and pet.name:
-                message = message.replace("{pet_name}", pet.name)
+        pet = follow_up.pet
+        if pet and pet.name:
+            message = message.replace("{pet_name}", pet.name)
         message = message.replace("{pet_name}", "tu mascota")
 
-        # Create conversation for the follow-up
-        conversation = Conversation(
-            clinic_id=follow_up.clinic_id,
-            client_id=client.id,
-            client_phone=client.phone,
-            channel="whatsapp",
-            conversation_type="follow_up",
-            state=ConversationState.COLLECT_STATUS.value,
-            status="active"
+        # Close a conversation the client left to time out, as the engine
+        # would on their next message
+        await self.db.execute(
+            update(Conversation)
+            .where(
+                Conversation.clinic_id == follow_up.clinic_id,
+                Conversation.client_phone == client.phone,
+                Conversation.status == "active",
+                Conversation.channel == "whatsapp",
+                ~_LIVE
+            )
+            .values(
+                status="abandoned",
+                state=ConversationState.CLOSED.value,
+                ended_at=func.now()
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+        # Create conversation for the follow-up, unless the client opened
+        # one since the batch was selected
+        stmt = (
+            pg_insert(Conversation)
+            .values(
+                clinic_id=follow_up.clinic_id,
+                client_id=client.id,
+                client_phone=client.phone,
+                channel="whatsapp",
+                conversation_type="follow_up",
+                state=ConversationState.COLLECT_STATUS.value,
+                status="active"
+            )
+            .on_conflict_do_nothing(
+                index_elements=[Conversation.clinic_id, Conversation.client_phone],
+                index_where=ACTIVE_WHATSAPP_CONVERSATION,
+            )
+            .returning(Conversation)
+        )
+        result = await self.db.execute(
+            select(Conversation).from_statement(stmt),
+            execution_options={"populate_existing": True},
         )
-        self.db.add(conversation)
-        await self.db.flush()
+        conversation = result.scalar_one_or_none()
+        if conversation is None:
+            logger.info(f"Follow-up {follow_up.id} deferred: {client.phone} is in a conversation")
+            return None
 
         # Update follow-up with conversation
         follow_up.conversation_id = conversation.id
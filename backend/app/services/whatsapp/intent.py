@@ -34,6 +34,15 @@ class IntentResult:
             self.emergency_keywords = []
 
 
+# Slot selection patterns, compiled once: (pattern, 0-indexed slot)
+SLOT_SELECTION_PATTERNS = [
+    (re.compile(r'^1$|primera|opción\s*1|uno|la\s*1'), 0),
+    (re.compile(r'^2$|segunda|opción\s*2|dos|la\s*2'), 1),
+    (re.compile(r'^3$|tercera|opción\s*3|tres|la\s*3'), 2),
+    (re.compile(r'^4$|cuarta|opción\s*4|cuatro|la\s*4'), 3),
+]
+
+
 class IntentClassifier:
     """Classifies user messages into intents."""
 
@@ -268,15 +277,12 @@ class IntentClassifier:
         message_lower = message.lower().strip()
 
         # Direct number selection
-        number_patterns = [
-            (r'^1$|primera|opción\s*1|uno|la\s*1', 0),
-            (r'^2$|segunda|opción\s*2|dos|la\s*2', 1),
-            (r'^3$|tercera|opción\s*3|tres|la\s*3', 2),
-            (r'^4$|cuarta|opción\s*4|cuatro|la\s*4', 3),
-        ]
-
-        for pattern, index in number_patterns:
-            if re.search(pattern, message_lower) and index < num_options:
+        for pattern, index in SLOT_SELECTION_PATTERNS:
+            if index < num_options and pattern.search(message_lower):
                 return index
 
         return None
+
+
+# Singleton instance (the classifier is stateless)
+intent_classifier = IntentClassifier()
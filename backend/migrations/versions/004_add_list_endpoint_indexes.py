@@ -0,0 +1,54 @@
+"""Add composite indexes matching list endpoint filters and ordering
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '004'
+down_revision: Union[str, None] = '003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Unfiltered (clinic_id, started_at) is already covered by idx_conversations_clinic;
+    # these serve the status/channel filters of the conversations list.
+    op.create_index(
+        'idx_conversations_clinic_status_started', 'conversations',
+        ['clinic_id', 'status', sa.text('started_at DESC')],
+    )
+    op.create_index(
+        'idx_conversations_clinic_channel_started', 'conversations',
+        ['clinic_id', 'channel', sa.text('started_at DESC')],
+    )
+
+    # Emergencies list filtered by status, newest first
+    op.create_index(
+        'idx_emergency_events_clinic_status_created', 'emergency_events',
+        ['clinic_id', 'status', sa.text('created_at DESC')],
+    )
+
+    # Demo requests list (admin), with and without status filter
+    op.create_index(
+        'idx_demo_requests_status_created', 'demo_requests',
+        ['status', sa.text('created_at DESC')],
+    )
+    op.create_index(
+        'idx_demo_requests_created', 'demo_requests',
+        [sa.text('created_at DESC')],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_demo_requests_created')
+    op.drop_index('idx_demo_requests_status_created')
+    op.drop_index('idx_emergency_events_clinic_status_created')
+    op.drop_index('idx_conversations_clinic_channel_started')
+    op.drop_index('idx_conversations_clinic_status_started')
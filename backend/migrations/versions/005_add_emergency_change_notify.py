@@ -0,0 +1,43 @@
+"""Notify listeners when emergency events change
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Invalidates the per-process active-emergencies cache
+    # (app.services.emergency_cache) with the affected clinic id
+    op.execute("""
+        CREATE OR REPLACE FUNCTION notify_emergency_change() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                PERFORM pg_notify('emergency_change', OLD.clinic_id::text);
+            ELSE
+                PERFORM pg_notify('emergency_change', NEW.clinic_id::text);
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER emergency_events_notify
+        AFTER INSERT OR UPDATE OR DELETE ON emergency_events
+        FOR EACH ROW EXECUTE FUNCTION notify_emergency_change()
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS emergency_events_notify ON emergency_events")
+    op.execute("DROP FUNCTION IF EXISTS notify_emergency_change()")
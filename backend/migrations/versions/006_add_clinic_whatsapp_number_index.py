@@ -0,0 +1,26 @@
+"""Index clinics.whatsapp_number for the inbound webhook lookup
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '006'
+down_revision: Union[str, None] = '005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # clinics.phone is already indexed by its unique constraint; with this the
+    # OR'd lookup can use a BitmapOr of index scans instead of a seqscan.
+    op.create_index('idx_clinics_whatsapp_number', 'clinics', ['whatsapp_number'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_clinics_whatsapp_number')
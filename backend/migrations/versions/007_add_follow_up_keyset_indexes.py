@@ -0,0 +1,37 @@
+"""Add follow-up indexes for keyset pagination
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '007'
+down_revision: Union[str, None] = '006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Match the (scheduled_at, id) ordering of the follow-ups list, with and
+    # without a status filter; the status one also serves the pending list.
+    op.create_index(
+        'idx_follow_ups_clinic_scheduled', 'follow_ups',
+        ['clinic_id', 'scheduled_at', 'id'],
+    )
+    op.create_index(
+        'idx_follow_ups_clinic_status_scheduled', 'follow_ups',
+        ['clinic_id', 'status', 'scheduled_at', 'id'],
+    )
+    # Superseded by the (clinic_id, status, ...) index above
+    op.drop_index('idx_follow_ups_clinic')
+
+
+def downgrade() -> None:
+    op.create_index('idx_follow_ups_clinic', 'follow_ups', ['clinic_id', 'status'])
+    op.drop_index('idx_follow_ups_clinic_status_scheduled')
+    op.drop_index('idx_follow_ups_clinic_scheduled')
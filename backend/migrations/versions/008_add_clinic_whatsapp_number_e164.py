@@ -0,0 +1,42 @@
+"""Add normalized clinics.whatsapp_number_e164 with a unique index
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '008'
+down_revision: Union[str, None] = '007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Digits only, so "+57 300-123", "57300123" etc. resolve with one point lookup
+    op.add_column(
+        'clinics',
+        sa.Column(
+            'whatsapp_number_e164',
+            sa.String(length=20),
+            sa.Computed(
+                "NULLIF(regexp_replace(whatsapp_number, '[^0-9]', '', 'g'), '')",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        'idx_clinics_whatsapp_number_e164', 'clinics', ['whatsapp_number_e164'],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_clinics_whatsapp_number_e164')
+    op.drop_column('clinics', 'whatsapp_number_e164')
@@ -0,0 +1,34 @@
+"""Add partial covering index for the pending follow-ups poll
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '009'
+down_revision: Union[str, None] = '008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Covers every column GET /follow-ups/pending loads, so the dashboard
+    # poll can be answered by an index-only scan
+    op.execute(
+        """
+        CREATE INDEX idx_follow_ups_clinic_pending_scheduled
+        ON follow_ups (clinic_id, scheduled_at)
+        INCLUDE (id, appointment_id, client_id, pet_id, message_template,
+                 sequence_number, status, sent_at)
+        WHERE status = 'pending'
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_follow_ups_clinic_pending_scheduled')
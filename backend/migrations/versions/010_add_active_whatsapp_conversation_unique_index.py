@@ -0,0 +1,62 @@
+"""Add partial unique index on active WhatsApp conversations per phone
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '010'
+down_revision: Union[str, None] = '009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Conversations opened by the orchestrator were only linked through
+    # client_id; fill in client_phone so the upsert can find them
+    op.execute(
+        """
+        UPDATE conversations c
+        SET client_phone = cl.phone
+        FROM clients cl
+        WHERE c.client_id = cl.id AND c.client_phone IS NULL
+        """
+    )
+
+    # Keep only the newest active WhatsApp conversation per phone
+    op.execute(
+        """
+        UPDATE conversations
+        SET status = 'abandoned', ended_at = now()
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id, row_number() OVER (
+                    PARTITION BY clinic_id, client_phone
+                    ORDER BY started_at DESC
+                ) AS rn
+                FROM conversations
+                WHERE status = 'active' AND channel = 'whatsapp'
+                  AND client_phone IS NOT NULL
+            ) ranked
+            WHERE rn > 1
+        )
+        """
+    )
+
+    # Conflict target for the get-or-create upsert in ConversationService
+    op.create_index(
+        'idx_conversations_active_whatsapp_phone', 'conversations',
+        ['clinic_id', 'client_phone'],
+        unique=True,
+        postgresql_where=sa.text("status = 'active' AND channel = 'whatsapp'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_conversations_active_whatsapp_phone')
@@ -0,0 +1,41 @@
+"""Add normalized clinics.phone_e164 with an index
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '011'
+down_revision: Union[str, None] = '010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Same normalization as whatsapp_number_e164, so the inbound-number
+    # fallback match on clinics.phone is an indexed equality as well.
+    # Not unique: phone is unique as entered, which doesn't carry over.
+    op.add_column(
+        'clinics',
+        sa.Column(
+            'phone_e164',
+            sa.String(length=20),
+            sa.Computed(
+                "NULLIF(regexp_replace(phone, '[^0-9]', '', 'g'), '')",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    op.create_index('idx_clinics_phone_e164', 'clinics', ['phone_e164'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_clinics_phone_e164')
+    op.drop_column('clinics', 'phone_e164')
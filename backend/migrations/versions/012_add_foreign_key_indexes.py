@@ -0,0 +1,64 @@
+"""Add indexes on foreign key columns not already covered by an index
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '012'
+down_revision: Union[str, None] = '011'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Postgres doesn't index referencing columns itself; without these, joins
+# from the parent side and ON DELETE checks/cascades scan the child table.
+# FKs that already lead an index (e.g. clients.clinic_id through
+# uq_client_clinic_phone, every other *.clinic_id) are left out.
+FOREIGN_KEY_INDEXES = [
+    ('idx_staff_clinic', 'staff', ['clinic_id']),
+    ('idx_pets_client', 'pets', ['client_id']),
+    ('idx_appointments_client', 'appointments', ['client_id']),
+    ('idx_appointments_pet', 'appointments', ['pet_id']),
+    ('idx_conversations_client', 'conversations', ['client_id']),
+    # Also serves history loads, which order by created_at
+    ('idx_conversation_messages_conversation_created', 'conversation_messages',
+     ['conversation_id', 'created_at']),
+    ('idx_client_otps_clinic', 'client_otps', ['clinic_id']),
+    ('idx_emergency_events_conversation', 'emergency_events', ['conversation_id']),
+    ('idx_emergency_events_client', 'emergency_events', ['client_id']),
+    ('idx_emergency_events_acknowledged_by', 'emergency_events', ['acknowledged_by']),
+    ('idx_emergency_events_resolved_by', 'emergency_events', ['resolved_by']),
+    ('idx_emergency_alerts_emergency', 'emergency_alerts', ['emergency_id']),
+    ('idx_follow_ups_appointment', 'follow_ups', ['appointment_id']),
+    ('idx_follow_ups_client', 'follow_ups', ['client_id']),
+    ('idx_follow_ups_pet', 'follow_ups', ['pet_id']),
+    ('idx_follow_ups_protocol', 'follow_ups', ['protocol_id']),
+    ('idx_follow_ups_conversation', 'follow_ups', ['conversation_id']),
+    ('idx_follow_up_responses_follow_up', 'follow_up_responses', ['follow_up_id']),
+    ('idx_follow_up_responses_conversation', 'follow_up_responses', ['conversation_id']),
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY so live tables aren't write-locked while indexes build;
+    # it can't run inside the migration transaction
+    with op.get_context().autocommit_block():
+        for name, table, columns in FOREIGN_KEY_INDEXES:
+            op.create_index(
+                name, table, columns,
+                postgresql_concurrently=True, if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(FOREIGN_KEY_INDEXES):
+            op.drop_index(
+                name, table_name=table,
+                postgresql_concurrently=True, if_exists=True,
+            )
@@ -0,0 +1,27 @@
+"""Add client_otps expiry index for the expired-code purge
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '013'
+down_revision: Union[str, None] = '012'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Lookups stay on idx_client_otps_phone_clinic (requesting a code
+    # replaces any previous one, so there is at most one row per pair);
+    # this lets the periodic purge find expired rows without a full scan
+    op.create_index('idx_client_otps_expires', 'client_otps', ['expires_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_client_otps_expires')
@@ -0,0 +1,32 @@
+"""Add BRIN index on appointments.created_at for analytics ranges
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '014'
+down_revision: Union[str, None] = '013'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Analytics counts appointments by clinic over a created_at window, which
+    # no index covers. created_at follows insertion order, so a BRIN index
+    # (a few pages in total) narrows the window to matching block ranges, and
+    # Postgres can AND it with the clinic_id prefix of idx_appointments_clinic_time.
+    op.create_index(
+        'idx_appointments_created_brin', 'appointments', ['created_at'],
+        postgresql_using='brin',
+        postgresql_with={'pages_per_range': 32},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_appointments_created_brin')
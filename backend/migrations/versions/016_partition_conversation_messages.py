@@ -0,0 +1,108 @@
+"""Partition conversation_messages by month of created_at
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-10-15
+
+"""
+from datetime import date, datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '016'
+down_revision: Union[str, None] = '015'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = 'id, conversation_id, role, content, audio_url, transcription_confidence, created_at'
+
+# Partitions ahead of the current month; app.services.message_partitions
+# keeps extending them from there
+MONTHS_AHEAD = 2
+
+
+def _month_start(day: date, months: int = 0) -> date:
+    index = day.year * 12 + day.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def upgrade() -> None:
+    # Rewrites the table: message writes block until the migration commits
+    op.execute('ALTER TABLE conversation_messages RENAME TO conversation_messages_unpartitioned')
+    op.execute(
+        'ALTER INDEX conversation_messages_pkey '
+        'RENAME TO conversation_messages_unpartitioned_pkey'
+    )
+    op.execute('DROP INDEX IF EXISTS idx_conversation_messages_conversation_created')
+
+    # The partition key has to be part of the primary key
+    op.execute("""
+        CREATE TABLE conversation_messages (
+            id UUID NOT NULL DEFAULT gen_random_uuid(),
+            conversation_id UUID NOT NULL
+                REFERENCES conversations (id) ON DELETE CASCADE,
+            role VARCHAR(20) NOT NULL,
+            content TEXT NOT NULL,
+            audio_url TEXT,
+            transcription_confidence FLOAT,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+            PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+    """)
+
+    oldest = op.get_bind().exec_driver_sql(
+        'SELECT min(created_at) FROM conversation_messages_unpartitioned'
+    ).scalar()
+    this_month = _month_start(datetime.now(timezone.utc).date())
+    month = _month_start(oldest.astimezone(timezone.utc).date()) if oldest else this_month
+    while month <= _month_start(this_month, MONTHS_AHEAD):
+        op.execute(
+            f"CREATE TABLE conversation_messages_{month:%Y_%m} "
+            f"PARTITION OF conversation_messages "
+            f"FOR VALUES FROM ('{month} 00:00+00') TO ('{_month_start(month, 1)} 00:00+00')"
+        )
+        month = _month_start(month, 1)
+    op.execute('CREATE TABLE conversation_messages_default PARTITION OF conversation_messages DEFAULT')
+
+    op.execute(f"""
+        INSERT INTO conversation_messages ({COLUMNS})
+        SELECT id, conversation_id, role, content, audio_url, transcription_confidence,
+               coalesce(created_at, now())
+        FROM conversation_messages_unpartitioned
+    """)
+    op.execute('DROP TABLE conversation_messages_unpartitioned')
+
+    # Created on the parent, so every partition gets its own (small) index
+    op.create_index(
+        'idx_conversation_messages_conversation_created', 'conversation_messages',
+        ['conversation_id', 'created_at'],
+    )
+
+
+def downgrade() -> None:
+    op.execute('ALTER TABLE conversation_messages RENAME TO conversation_messages_partitioned')
+    op.execute('DROP INDEX IF EXISTS idx_conversation_messages_conversation_created')
+    op.execute("""
+        CREATE TABLE conversation_messages (
+            id UUID NOT NULL DEFAULT gen_random_uuid(),
+            conversation_id UUID NOT NULL
+                REFERENCES conversations (id) ON DELETE CASCADE,
+            role VARCHAR(20) NOT NULL,
+            content TEXT NOT NULL,
+            audio_url TEXT,
+            transcription_confidence FLOAT,
+            created_at TIMESTAMP WITH TIME ZONE DEFAULT now()
+        )
+    """)
+    op.execute(f"""
+        INSERT INTO conversation_messages ({COLUMNS})
+        SELECT {COLUMNS} FROM conversation_messages_partitioned
+    """)
+    op.execute('DROP TABLE conversation_messages_partitioned')
+    op.execute('ALTER TABLE conversation_messages ADD PRIMARY KEY (id)')
+    op.create_index(
+        'idx_conversation_messages_conversation_created', 'conversation_messages',
+        ['conversation_id', 'created_at'],
+    )
@@ -0,0 +1,21 @@
+"""Tests for database helpers."""
+
+import time
+
+from app.database import uuid7
+
+
+def test_uuid7_version_and_variant():
+    """Generated ids are RFC 9562 version 7 UUIDs."""
+    value = uuid7()
+    assert value.version == 7
+    assert value.variant == "specified in RFC 4122"
+
+
+def test_uuid7_is_time_ordered():
+    """Ids from later milliseconds sort after earlier ones."""
+    first = uuid7()
+    time.sleep(0.002)
+    second = uuid7()
+    assert first < second
+    assert first.int >> 80 <= time.time_ns() // 1_000_000
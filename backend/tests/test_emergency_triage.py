@@ -0,0 +1,55 @@
+"""Tests for the keyword pre-triage of emergency messages."""
+
+from app.prompts.emergency import critical_symptoms, fast_triage
+
+
+def test_fast_triage_flags_critical_signs():
+    """Critical signs match regardless of case and accents."""
+    assert fast_triage("Mi perro está CONVULSIONANDO") == "critical"
+    assert fast_triage("se cayó y perdió el conocimiento") == "critical"
+    assert fast_triage("Tiene dificultad para respirar desde hace una hora") == "critical"
+    assert fast_triage("mi gata no respira bien") == "critical"
+
+
+def test_fast_triage_ignores_routine_messages():
+    """Routine requests fall through to the LLM triage."""
+    assert fast_triage("Quiero agendar la vacuna de mi perro") is None
+    assert fast_triage("¿A qué hora abren el sábado?") is None
+
+
+def test_fast_triage_ignores_topics_and_questions():
+    """Mentioning a danger, or asking about one, is left to the LLM."""
+    assert fast_triage("¿El chocolate es veneno para los perros?") is None
+    assert fast_triage("¿Venden raticida seguro para mascotas?") is None
+    assert fast_triage("¿Qué hago si mi gato se intoxica?") is None
+    assert fast_triage("¿Qué hago si no respira?") is None
+    assert fast_triage(
+        "Mi perro no ha tenido convulsiones desde que toma el medicamento, "
+        "quiero renovar la receta"
+    ) is None
+
+
+def test_fast_triage_ignores_negated_and_hypothetical_signs():
+    """A sign that is negated, conditional or averted is not an emergency."""
+    assert fast_triage("Ya no tiene dificultad para respirar, gracias") is None
+    assert fast_triage("Nunca está inconsciente, solo duerme mucho") is None
+    assert fast_triage("si no respira bien lo llevo mañana") is None
+    assert fast_triage("Casi lo atropella un carro pero está bien, quiero agendar baño") is None
+
+
+def test_fast_triage_matches_whole_words():
+    """Past or other forms of a sign don't match; listed stems still inflect."""
+    assert fast_triage("Ayer no respiraba bien pero ya está mejor") is None
+    assert fast_triage("Se convulsionó la semana pasada") is None
+    assert fast_triage("Está desmayada en el piso") == "critical"
+
+
+def test_fast_triage_checks_each_sentence():
+    """A question next to a stated sign does not hide the sign."""
+    assert fast_triage("¿Qué hago? Mi gata está inconsciente") == "critical"
+
+
+def test_critical_symptoms_deduplicates_in_order():
+    """Each matched sign is reported once, in order of appearance."""
+    message = "Está convulsionando otra vez. Ahora está inconsciente y está convulsionando"
+    assert critical_symptoms(message) == ["esta convulsionando", "esta inconsciente"]
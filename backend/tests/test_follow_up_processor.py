@@ -0,0 +1,125 @@
+"""Tests for the follow-up processor against PostgreSQL (skipped without one)."""
+
+import asyncio
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select, text
+
+from app.database import Base, close_db, get_engine, get_session_maker
+from app.models import Appointment, Client, Clinic, Conversation, FollowUp
+from app.services.message_partitions import ensure_message_partitions
+from app.services.whatsapp import follow_up_processor
+from app.services.whatsapp.follow_up_processor import FollowUpProcessor
+
+
+@pytest_asyncio.fixture
+async def db():
+    """Session on a schema created from the models."""
+    engine = get_engine()
+    try:
+        async with asyncio.timeout(3):
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+    except (OSError, TimeoutError) as e:
+        await close_db()
+        pytest.skip(f"PostgreSQL not available: {e}")
+    await ensure_message_partitions()
+
+    async with get_session_maker()() as session:
+        yield session
+    await close_db()
+
+
+async def _seed(db, timeout_at):
+    """A clinic whose client has an active WhatsApp conversation and a due follow-up."""
+    suffix = uuid.uuid4().hex[:8]
+    phone = f"+57300{int(suffix, 16) % 10**7:07d}"
+    clinic = Clinic(name="Test", phone=f"+1{suffix}", escalation_contacts=[])
+    db.add(clinic)
+    await db.flush()
+    client = Client(clinic_id=clinic.id, phone=phone)
+    db.add(client)
+    await db.flush()
+    start = datetime.now(timezone.utc) - timedelta(days=1)
+    appointment = Appointment(
+        clinic_id=clinic.id, client_id=client.id, start_time=start,
+        end_time=start + timedelta(minutes=30), duration_minutes=30,
+        appointment_type="surgery", source="manual",
+    )
+    db.add(appointment)
+    await db.flush()
+    inbound = Conversation(
+        clinic_id=clinic.id, client_id=client.id, client_phone=phone,
+        channel="whatsapp", status="active", timeout_at=timeout_at,
+    )
+    follow_up = FollowUp(
+        clinic_id=clinic.id, appointment_id=appointment.id, client_id=client.id,
+        message_template="Hola, ¿cómo sigue {pet_name}?",
+        scheduled_at=datetime.utcnow() - timedelta(minutes=1),
+    )
+    db.add_all([inbound, follow_up])
+    await db.commit()
+    return clinic, follow_up
+
+
+async def _active_conversation_types(db, clinic):
+    return (await db.execute(
+        select(Conversation.conversation_type).where(
+            Conversation.clinic_id == clinic.id,
+            Conversation.status == "active",
+        )
+    )).scalars().all()
+
+
+async def _delete_clinic(db, clinic):
+    await db.rollback()
+    await db.execute(text("DELETE FROM clinics WHERE id = :id"), {"id": clinic.id})
+    await db.commit()
+
+
+@pytest.fixture
+def sent_messages(monkeypatch):
+    sent = []
+
+    async def send(to_phone, message, media_url=None):
+        sent.append(to_phone)
+        return {"status": "sent"}
+
+    monkeypatch.setattr(follow_up_processor.whatsapp_sender, "send", send)
+    return sent
+
+
+@pytest.mark.asyncio
+async def test_follow_up_replaces_timed_out_conversation(db, sent_messages):
+    """A conversation the client left to time out is closed and the follow-up is sent."""
+    expired = datetime.now(timezone.utc) - timedelta(hours=1)
+    clinic, follow_up = await _seed(db, timeout_at=expired)
+    try:
+        summary = await FollowUpProcessor(db).process_pending_follow_ups()
+        assert summary["failed"] == 0
+
+        status = await db.scalar(select(FollowUp.status).where(FollowUp.id == follow_up.id))
+        assert status == "sent"
+        assert await _active_conversation_types(db, clinic) == ["follow_up"]
+    finally:
+        await _delete_clinic(db, clinic)
+
+
+@pytest.mark.asyncio
+async def test_follow_up_waits_for_live_conversation(db, sent_messages):
+    """A client mid-conversation keeps it; the follow-up stays pending."""
+    live_until = datetime.now(timezone.utc) + timedelta(minutes=10)
+    clinic, follow_up = await _seed(db, timeout_at=live_until)
+    try:
+        summary = await FollowUpProcessor(db).process_pending_follow_ups()
+        assert summary["failed"] == 0
+        assert sent_messages == []
+
+        status = await db.scalar(select(FollowUp.status).where(FollowUp.id == follow_up.id))
+        assert status == "pending"
+        assert await _active_conversation_types(db, clinic) == ["inbound"]
+    finally:
+        await _delete_clinic(db, clinic)
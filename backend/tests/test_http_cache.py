@@ -0,0 +1,39 @@
+"""Tests for HTTP conditional-request helpers."""
+
+from starlette.requests import Request
+
+from app.api.http_cache import build_etag, etag_matches, not_modified
+
+
+def make_request(if_none_match: str | None = None) -> Request:
+    """Build a bare GET request with an optional If-None-Match header."""
+    headers = []
+    if if_none_match is not None:
+        headers.append((b"if-none-match", if_none_match.encode()))
+    return Request({"type": "http", "method": "GET", "headers": headers})
+
+
+def test_build_etag_is_stable_and_weak():
+    """Same inputs give the same weak ETag; different inputs differ."""
+    etag = build_etag("a", 1, None)
+    assert etag == build_etag("a", 1, None)
+    assert etag != build_etag("a", 2, None)
+    assert etag.startswith('W/"')
+
+
+def test_etag_matches():
+    """If-None-Match matching handles lists, wildcards and absence."""
+    etag = build_etag("x")
+    assert etag_matches(make_request(etag), etag)
+    assert etag_matches(make_request(f'W/"other", {etag}'), etag)
+    assert etag_matches(make_request("*"), etag)
+    assert not etag_matches(make_request('W/"other"'), etag)
+    assert not etag_matches(make_request(), etag)
+
+
+def test_not_modified():
+    """304 responses carry the ETag and no body."""
+    response = not_modified('W/"abc"')
+    assert response.status_code == 304
+    assert response.headers["etag"] == 'W/"abc"'
+    assert response.body == b""
@@ -0,0 +1,17 @@
+"""Tests for conversation message partition naming."""
+
+from datetime import date
+
+from app.services.message_partitions import month_start, partition_name
+
+
+def test_month_start_rolls_over_years():
+    """Month arithmetic crosses year boundaries in both directions."""
+    assert month_start(date(2026, 10, 15)) == date(2026, 10, 1)
+    assert month_start(date(2026, 11, 30), 2) == date(2027, 1, 1)
+    assert month_start(date(2026, 1, 31), -1) == date(2025, 12, 1)
+
+
+def test_partition_name():
+    """Partitions are named by zero-padded year and month."""
+    assert partition_name(date(2027, 3, 1)) == "conversation_messages_2027_03"